@@ -0,0 +1,36 @@
+"""
+Benchmarks for CrossSelect operations over increasing option counts.
+"""
+from paramnb.widgets import CrossSelect
+
+from .common import headless, close_all
+
+
+class CrossSelectOperations(object):
+
+    params = [10, 100, 1000, 5000]
+    param_names = ['n_options']
+
+    def setup(self, n):
+        self.headless = headless()
+        self.headless.__enter__()
+        self.options = ['option %d' % i for i in range(n)]
+        self.widget = CrossSelect(options=self.options, value=self.options[:n//2])
+
+    def teardown(self, n):
+        close_all()
+        self.headless.__exit__(None, None, None)
+
+    def time_init(self, n):
+        CrossSelect(options=self.options, value=self.options[:n//2])
+
+    def time_filter(self, n):
+        self.widget._search[False].value = 'option 1'
+        self.widget._search[False].value = ''
+
+    def time_apply_selection(self, n):
+        self.widget._lists[False].value = self.widget._lists[False].options[:10]
+        self.widget._apply_selection(self.widget._buttons[True])
+
+    def time_set_value(self, n):
+        self.widget.value = self.options[n//2:]
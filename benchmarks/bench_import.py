@@ -0,0 +1,18 @@
+"""
+Benchmarks for import times, each measured in a fresh interpreter.
+"""
+
+
+class Import(object):
+
+    def timeraw_import_paramnb(self):
+        return "import paramnb"
+
+    def timeraw_import_view(self):
+        return "from paramnb.view import HTML, Image"
+
+    def timeraw_import_jsoninit(self):
+        return "from paramnb import JSONInit"
+
+    def timeraw_import_widgets(self):
+        return "from paramnb import Widgets"
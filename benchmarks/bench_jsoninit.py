@@ -0,0 +1,44 @@
+"""
+Benchmarks for JSONInit applied to many objects from a large spec.
+"""
+import os
+import json
+import shutil
+import tempfile
+
+import paramnb
+
+from .common import make_parameterized
+
+
+class JSONInitSpec(object):
+
+    params = [[10, 1000], ['file', 'env']]
+    param_names = ['n_targets', 'source']
+
+    def setup(self, n, source):
+        self.objects = [make_parameterized(20) for _ in range(10)]
+        values = {'p%d' % i: 0.25 for i in range(0, 20, 6)}
+        spec = {'Target%d' % i: values for i in range(n - 1)}
+        spec[type(self.objects[0]).__name__] = values
+        self.tmpdir = tempfile.mkdtemp()
+        fname = os.path.join(self.tmpdir, 'spec.json')
+        with open(fname, 'w') as f:
+            json.dump(spec, f)
+        self.environ = os.environ.get('PARAMNB_INIT')
+        if source == 'file':
+            self.init = paramnb.JSONInit(json_file=fname)
+        else:
+            os.environ['PARAMNB_INIT'] = json.dumps(spec)
+            self.init = paramnb.JSONInit()
+
+    def teardown(self, n, source):
+        shutil.rmtree(self.tmpdir)
+        if self.environ is None:
+            os.environ.pop('PARAMNB_INIT', None)
+        else:
+            os.environ['PARAMNB_INIT'] = self.environ
+
+    def time_init_objects(self, n, source):
+        for obj in self.objects:
+            self.init(obj)
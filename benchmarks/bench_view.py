@@ -0,0 +1,47 @@
+"""
+Benchmarks for View update throughput, from setting the parameter to
+the displayed output.
+"""
+import param
+
+import paramnb
+from paramnb.view import HTML, Image
+
+from .common import headless, close_all
+
+# 1x1 transparent PNG
+PNG = (b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+       b'\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\xf8\x0f'
+       b'\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82')
+
+
+class Views(param.Parameterized):
+
+    html = HTML()
+
+    image = Image()
+
+
+class ViewUpdate(object):
+
+    params = [['html', 'image'], [1, 1000, 100000]]
+    param_names = ['view', 'size']
+
+    def setup(self, view, size):
+        self.headless = headless()
+        self.headless.__enter__()
+        self.views = Views()
+        paramnb.Widgets(self.views)
+        if view == 'html':
+            self.values = ['<p>%s</p>' % (c * size) for c in 'ab']
+        else:
+            self.values = [PNG + c * size for c in (b'a', b'b')]
+
+    def teardown(self, view, size):
+        close_all()
+        self.headless.__exit__(None, None, None)
+
+    def time_update(self, view, size):
+        for _ in range(20):
+            for value in self.values:
+                setattr(self.views, view, value)
@@ -0,0 +1,66 @@
+"""
+Benchmarks for building a property sheet and the change_event ->
+execute round trip of Widgets.
+"""
+import ipywidgets
+
+import paramnb
+
+from .common import headless, close_all, make_parameterized
+
+
+class WidgetsSheet(object):
+    """Construction of the whole sheet by Widgets.__call__."""
+
+    params = [10, 100, 1000, 5000]
+    param_names = ['n_params']
+
+    timeout = 300
+
+    def setup(self, n):
+        self.parameterized = make_parameterized(n)
+        self.headless = headless()
+        self.headless.__enter__()
+
+    def teardown(self, n):
+        close_all()
+        self.headless.__exit__(None, None, None)
+
+    def time_call(self, n):
+        paramnb.Widgets(self.parameterized)
+
+    def track_models(self, n):
+        before = len(ipywidgets.Widget.widgets)
+        paramnb.Widgets(self.parameterized)
+        return len(ipywidgets.Widget.widgets) - before
+    track_models.unit = 'models'
+
+
+class ChangeEvent(object):
+    """
+    Round trip from a widget value change through parameter validation
+    to the user callback.
+    """
+
+    params = ['p0', 'p1', 'p3', 'p5']
+    param_names = ['parameter']
+
+    values = {'p0': (0.25, 0.75), 'p1': (2, 8),
+              'p3': ('a', 'b'), 'p5': ('[1]', '[1, 2, 3, 4]')}
+
+    def setup(self, pname):
+        self.headless = headless()
+        self.headless.__enter__()
+        self.widgets = paramnb.Widgets.instance()
+        self.widgets(make_parameterized(10), callback=lambda obj, **kw: None)
+        self.widget = self.widgets.widget(pname)
+
+    def teardown(self, pname):
+        close_all()
+        self.headless.__exit__(None, None, None)
+
+    def time_change_event(self, pname):
+        first, second = self.values[pname]
+        for _ in range(50):
+            self.widget.value = first
+            self.widget.value = second
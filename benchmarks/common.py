@@ -0,0 +1,104 @@
+"""
+Headless stand-ins for the notebook frontend, allowing paramnb to be
+benchmarked without a browser or a running kernel.
+
+Every widget gets a FakeComm that records the messages ipywidgets
+would otherwise send over the websocket, and the IPython display
+machinery used by paramnb is replaced by FakeDisplay.
+"""
+import uuid
+from contextlib import contextmanager
+
+import param
+from param.parameterized import ParameterizedMetaclass
+import ipywidgets
+
+import paramnb.core
+
+try:
+    from ipywidgets.widgets.widget import _remove_buffers
+except ImportError:
+    def _remove_buffers(state):
+        return state, [], []
+
+
+class FakeComm(object):
+    """
+    Minimal comm accepting everything a Widget sends to its frontend
+    model and keeping the messages around for inspection.
+    """
+
+    # ipywidgets only sends state updates if the comm has a kernel
+    kernel = True
+
+    def __init__(self, data=None):
+        self.comm_id = uuid.uuid4().hex
+        self.messages = [] if data is None else [data]
+
+    def send(self, data=None, metadata=None, buffers=None):
+        self.messages.append(data)
+
+    def on_msg(self, callback):
+        pass
+
+    def close(self, data=None, metadata=None, buffers=None, deleting=False):
+        pass
+
+
+def open_fake_comm(widget):
+    """Replacement for Widget.open creating a FakeComm."""
+    if widget.comm is None:
+        state, buffer_paths, buffers = _remove_buffers(widget.get_state())
+        widget.comm = FakeComm(dict(state=state, buffer_paths=buffer_paths))
+
+
+class FakeDisplayHandle(object):
+
+    def display(self, obj, **kwargs):
+        pass
+
+    def update(self, obj, **kwargs):
+        pass
+
+
+def fake_display(*objs, **kwargs):
+    return FakeDisplayHandle() if kwargs.get('display_id') else None
+
+
+@contextmanager
+def headless():
+    """
+    Context manager installing the fake comm and display stand-ins.
+    """
+    core = paramnb.core
+    original = (ipywidgets.Widget.open, core.display, core.clear_output)
+    ipywidgets.Widget.open = open_fake_comm
+    core.display = fake_display
+    core.clear_output = lambda wait=False: None
+    try:
+        yield
+    finally:
+        ipywidgets.Widget.open, core.display, core.clear_output = original
+
+
+def close_all():
+    """Close all widgets, so benchmarks do not accumulate models."""
+    ipywidgets.Widget.close_all()
+
+
+def make_parameterized(n):
+    """
+    Returns an instance of a Parameterized class declaring n
+    parameters, cycling through the commonly used parameter types.
+    """
+    makers = [
+        lambda: param.Number(default=0.5, bounds=(0, 1)),
+        lambda: param.Integer(default=5, bounds=(0, 10)),
+        lambda: param.Boolean(default=True),
+        lambda: param.ObjectSelector(default='a', objects=['a', 'b', 'c']),
+        lambda: param.String(default='text'),
+        lambda: param.List(default=[1, 2, 3]),
+    ]
+    params = {'p%d' % i: makers[i % len(makers)]() for i in range(n)}
+    cls = ParameterizedMetaclass('Benchmark%d' % n, (param.Parameterized,), params)
+    return cls(name='Benchmark')
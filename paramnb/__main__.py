@@ -1,8 +1,14 @@
+import sys
+
+
 def main(args=None):
+    args = sys.argv[1:] if args is None else args
+    if args[:1] == ['serve']:
+        from .serve import main as serve
+        return serve(args[1:])
     try:
         import pyct.cmd
     except ImportError:
-        import sys
         from . import _missing_cmd
         print(_missing_cmd())
         sys.exit(1)
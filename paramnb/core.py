@@ -0,0 +1,795 @@
+"""
+The Widgets property sheet, generating an ipywidget for each Parameter
+of a Parameterized object and keeping the two in sync.
+"""
+from __future__ import absolute_import
+
+import uuid
+import itertools
+import threading
+import functools
+from collections import OrderedDict
+
+import param
+import ipywidgets
+from IPython.display import display, Javascript, HTML, clear_output
+
+from . import widgets
+from .widgets import (wtype, apply_error_style, literal_params, parse_literal,
+                      format_literal, pooled, shared_layout, close_widget,
+                      error_css, Output, DropdownWithEdit)
+from .util import (named_objs, get_method_owner, is_awaitable, asyncio,
+                   running_loop, resolve)
+from .view import View, HTML as HTMLView
+from .stats import CommStats
+from .timing import Profiler, null_timer, clock
+from .session import Recorder
+from .snapshot import load_snapshot, save_snapshot
+from .group import PanelGroup
+
+
+def run_next_cells(n):
+    if n=='all':
+        n = 'NaN'
+    elif n<1:
+        return
+
+    js_code = """
+       var num = {0};
+       var run = false;
+       var current = $(this)[0];
+       $.each(IPython.notebook.get_cells(), function (idx, cell) {{
+          if ((cell.output_area === current) && !run) {{
+             run = true;
+          }} else if ((cell.cell_type == 'code') && !(num < 1) && run) {{
+             cell.execute();
+             num = num - 1;
+          }}
+       }});
+    """.format(n)
+
+    display(Javascript(js_code))
+
+
+def estimate_label_width(labels):
+    """
+    Given a list of labels, estimate the width in pixels
+    and return in a format accepted by CSS.
+    Necessarily an approximation, since the font is unknown
+    and is usually proportionally spaced.
+    """
+    max_length = max([len(l) for l in labels])
+    return "{0}px".format(max(60,int(max_length*7.5)))
+
+
+class Widgets(param.ParameterizedFunction):
+
+    callback = param.Callable(default=None, doc="""
+        Custom callable to execute on button press
+        (if `button`) else whenever a widget is changed,
+        Should accept a Parameterized object argument. May be a
+        coroutine function, in which case it is scheduled on the
+        kernel's event loop and any still running invocation is
+        cancelled when a newer change supersedes it.""")
+
+    view_position = param.ObjectSelector(default='below',
+                                         objects=['below', 'right', 'left', 'above'],
+                                         doc="""
+        Layout position of any View parameter widgets.""")
+
+    next_n = param.Parameter(default=0, doc="""
+        When executing cells, integer number to execute (or 'all').
+        A value of zero means not to control cell execution.""")
+
+    on_init = param.Boolean(default=False, doc="""
+        Whether to do the action normally taken (executing cells
+        and/or calling a callable) when first instantiating this
+        object.""")
+
+    close_button = param.Boolean(default=False, doc="""
+        Whether to show a button allowing the Widgets to be closed.""")
+
+    button = param.Boolean(default=False, doc="""
+        Whether to show a button to control cell execution.
+        If false, will execute `next` cells on any widget
+        value change.""")
+
+    label_width = param.Parameter(default=estimate_label_width, doc="""
+        Width of the description for parameters in the list, using any
+        string specification accepted by CSS (e.g. "100px" or "50%").
+        If set to a callable, will call that function using the list of
+        all labels to get the value.""")
+
+    tooltips = param.Boolean(default=True, doc="""
+        Whether to add tooltips to the parameter names to show their
+        docstrings.""")
+
+    show_labels = param.Boolean(default=True)
+
+    display_threshold = param.Number(default=0,precedence=-10,doc="""
+        Parameters with precedence below this value are not displayed.""")
+
+    default_precedence = param.Number(default=1e-8,precedence=-10,doc="""
+        Precedence value to use for parameters with no declared precedence.
+        By default, zero predecence is available for forcing some parameters
+        to the top of the list, and other values above the default_precedence
+        values can be used to sort or group parameters arbitrarily.""")
+
+    initializer = param.Callable(default=None, doc="""
+        User-supplied function that will be called on initialization,
+        usually to update the default Parameter values of the
+        underlying parameterized object. May be a coroutine function,
+        in which case the widgets are displayed once it completes.""")
+
+    layout = param.ObjectSelector(default='column',
+                                  objects=['row','column'],doc="""
+        Whether to lay out the buttons as a row or a column.""")
+
+    continuous_update = param.Boolean(default=False, doc="""
+        If true, will continuously update the next_n and/or callback,
+        if any, as a slider widget is dragged.""")
+
+    track_comms = param.Boolean(default=False, precedence=-10, doc="""
+        Whether to count the comm models opened and the messages and
+        bytes exchanged with the frontend, per parameter and View. The
+        counts are available as a CommStats object on the comm_stats
+        attribute, e.g. use comm_stats.measure() to measure the
+        traffic caused by a single interaction.""")
+
+    profiler = param.ClassSelector(default=None, class_=Profiler, precedence=-10, doc="""
+        Optional Profiler recording the time spent in each stage of
+        handling a change, from evaluating the widget value to
+        displaying the rendered Views.""")
+
+    recorder = param.ClassSelector(default=None, class_=Recorder, precedence=-10, doc="""
+        Optional Recorder logging every widget change and button
+        click, so that the session can be replayed later.""")
+
+    snapshot = param.String(default=None, allow_None=True, precedence=-10, doc="""
+        Optional directory in which to save the rendered View outputs
+        after each execution, keyed on the class of the parameterized
+        object, a hash of its source and a hash of its parameter
+        values. When the panel is opened with values for which a
+        snapshot exists, its outputs are shown at once and, if on_init
+        is set, recomputed in the background: on an event loop, a
+        synchronous callback then runs on a worker thread, so it must
+        not interact with widgets itself.""")
+
+    group = param.ClassSelector(default=None, class_=PanelGroup, precedence=-10, doc="""
+        Optional PanelGroup linking parameters with those of other
+        panels, through which all changes are then dispatched.""")
+
+    # Nesting level of sub-object editor panels
+    _depth = 0
+
+    def __call__(self, parameterized, plots=[],  **params):
+        self._setup(parameterized, **params)
+        self._initialize(plots)
+
+
+    def _initialize(self, plots, show=True):
+        """
+        Runs any initializer and builds the panel, once the
+        initializer has completed if it is a coroutine function.
+        """
+        if self.p.initializer:
+            initialized = self.p.initializer(self.parameterized)
+            if is_awaitable(initialized):
+                # Display an empty container right away and populate
+                # it once the initializer has completed on the loop
+                container = pooled(ipywidgets.VBox)
+                if show:
+                    display(container)
+                self._widget_box = container
+                self._schedule('__initializer__', initialized,
+                               lambda _: self._build(plots, container))
+                return
+        self._build(plots, show=show)
+
+
+    def _setup(self, parameterized, **params):
+        self.p = param.ParamOverrides(self, params)
+
+        self._id = uuid.uuid4().hex
+        self._widgets = {}
+        self._widget_values = {}
+        self._tasks = {}
+        self._callback_changed = {}
+        self._executions = 0
+        self._worker = threading.local()
+        self._run_button = None
+        self.comm_stats = CommStats() if self.p.track_comms else None
+        self.parameterized = parameterized
+        self._save_handle = None
+        self._rendered = {}
+        self._restored = {}
+        self._syncing = None
+
+        if self.p.group is not None:
+            self.p.group.add(self)
+
+        if self.p.recorder is not None:
+            cls = type(parameterized) if not isinstance(parameterized, type) else parameterized
+            self.p.recorder.target = '%s.%s' % (cls.__module__, cls.__name__)
+
+
+    def _build(self, plots, container=None, show=True):
+        if self.p.snapshot is not None:
+            self._restore_snapshot()
+        widgets, views = self.widgets()
+        layout = shared_layout(display='flex', flex_flow=self.p.layout,
+                               border='solid 1px' if self.p.close_button else None)
+
+        widget_box = pooled(ipywidgets.VBox, children=widgets, layout=layout)
+        plot_outputs = tuple(pooled(Output) for p in plots)
+        if views or plots:
+            outputs = tuple(views.values()) + plot_outputs
+            view_box = pooled(ipywidgets.VBox, children=outputs, layout=layout)
+            layout = self.p.view_position
+            if layout in ['below', 'right']:
+                children = [widget_box, view_box]
+            else:
+                children = [view_box, widget_box]
+            box = ipywidgets.VBox if layout in ['below', 'above'] else ipywidgets.HBox
+            widget_box = pooled(box, children=children)
+
+        if container is None:
+            if show:
+                display(widget_box)
+            self._widget_box = widget_box
+        else:
+            container.children = (widget_box,)
+
+        if self.comm_stats is not None:
+            for pname, w in self._widgets.items():
+                self.comm_stats.track(w, pname)
+            self.comm_stats.track(self._widget_box)
+
+        self._display_handles = {}
+        # Render defined View parameters
+        for pname, view in views.items():
+            if pname in self._restored:
+                self._display_trait(pname, self._restored[pname])
+                continue
+            p_obj = self.parameterized.params(pname)
+            value = getattr(self.parameterized, pname)
+            if value is None:
+                continue
+            self._update_trait(pname, p_obj.renderer(value))
+
+        # Render supplied plots
+        for p, o in zip(plots, plot_outputs):
+            with o:
+                display(p)
+
+        # Keeps track of changes between button presses
+        self._changed = {}
+
+        if self.p.on_init:
+            if self._restored:
+                self._revalidate()
+            else:
+                self.execute()
+
+
+    def _restore_snapshot(self):
+        """
+        Keeps the rendered View outputs of any snapshot saved for the
+        current parameter values for display in place of rendering.
+        """
+        outputs = load_snapshot(self.p.snapshot, self.parameterized)
+        if not outputs:
+            return
+        known = self.parameterized.params()
+        self._restored = {name: output for name, output in outputs.items()
+                          if isinstance(known.get(name), View)}
+        self._rendered.update(self._restored)
+
+
+    def _revalidate(self):
+        """
+        Executes the callback for the restored values. On an event loop
+        the callback runs on a worker thread, keeping the restored panel
+        responsive, and the Views it renders are displayed from the
+        loop once it completes, unless a change was executed meanwhile.
+        """
+        loop = running_loop()
+        if loop is None or self.p.callback is None:
+            self.execute()
+            return
+        run_next_cells(self.p.next_n)
+        executions = self._executions
+
+        def revalidate():
+            self._worker.rendered = rendered = OrderedDict()
+            try:
+                return self._call_callback({}), rendered
+            finally:
+                del self._worker.rendered
+
+        def done(future):
+            if self._executions != executions:
+                return
+            try:
+                result, rendered = future.result()
+            except Exception as e:
+                self.warning('Revalidation raised %s: %s' % (type(e).__name__, e))
+                return
+            for p_name, p_value in rendered.items():
+                self._update_trait(p_name, p_value)
+            if is_awaitable(result):
+                self._schedule('__callback__', result, stage='callback')
+            self._request_snapshot()
+
+        loop.run_in_executor(None, revalidate).add_done_callback(done)
+
+
+    # Seconds without further executions before a snapshot is saved
+    _snapshot_delay = 1.0
+
+    def _request_snapshot(self):
+        """
+        Saves a snapshot once executions have settled when running on
+        an event loop, otherwise right away.
+        """
+        if self.p.snapshot is None:
+            return
+        loop = running_loop()
+        if loop is None:
+            self._save_snapshot()
+            return
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._save_handle = loop.call_later(self._snapshot_delay, self._save_snapshot)
+
+
+    def _save_snapshot(self):
+        self._save_handle = None
+        try:
+            save_snapshot(self.p.snapshot, self.parameterized, self._rendered)
+        except Exception as e:
+            self.warning('Could not save snapshot: %s' % e)
+
+
+    def _schedule(self, key, awaitable, on_done=None, stage=None):
+        """
+        Schedules the awaitable on the running (kernel) event loop,
+        cancelling any task still in flight under the same key, and
+        passes the result to on_done once it completes. If a stage is
+        given, the time until completion is recorded by the profiler.
+        Outside of an event loop, e.g. during a headless Replay, the
+        awaitable is run to completion right away.
+        """
+        previous = self._tasks.pop(key, None)
+        if previous is not None and not previous.done():
+            previous.cancel()
+
+        profiler, start = self.p.profiler, clock()
+
+        def finish(exception, result):
+            if stage is not None and profiler is not None:
+                profiler.record(stage, None if key == '__callback__' else key,
+                                start, clock() - start)
+            if exception is not None:
+                self.warning('%r raised %s: %s' % (key, type(exception).__name__, exception))
+            elif on_done is not None:
+                on_done(result)
+
+        if running_loop() is None:
+            try:
+                result = resolve(awaitable)
+            except Exception as e:
+                finish(e, None)
+            else:
+                finish(None, result)
+            return None
+
+        task = asyncio.ensure_future(awaitable)
+        self._tasks[key] = task
+
+        def done(task):
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+            if task.cancelled():
+                return
+            exception = task.exception()
+            finish(exception, None if exception is not None else task.result())
+            # Outputs completed after the execution are saved too
+            self._request_snapshot()
+
+        task.add_done_callback(done)
+        return task
+
+
+    def _update_trait(self, p_name, p_value, widget=None):
+        rendered = getattr(self._worker, 'rendered', None)
+        if rendered is not None:
+            # Rendered on the revalidation thread, displayed when done
+            rendered[p_name] = p_value
+            return
+        if is_awaitable(p_value):
+            # Asynchronous renderer; newer values supersede pending ones
+            self._schedule(p_name, p_value, functools.partial(
+                self._update_trait, p_name, widget=widget), stage='render')
+            return
+
+        with self._timer('display', p_name):
+            self._display_trait(p_name, p_value, widget)
+        if self.p.snapshot is not None:
+            self._rendered[p_name] = p_value
+
+
+    def _display_trait(self, p_name, p_value, widget=None):
+        p_obj = self.parameterized.params(p_name)
+        widget = self._widgets[p_name] if widget is None else widget
+        if isinstance(p_value, tuple):
+            p_value, size = p_value
+
+            if isinstance(size, tuple) and len(size) == 2:
+                if isinstance(widget, ipywidgets.Image):
+                    widget.width = size[0]
+                    widget.height = size[1]
+                else:
+                    widget.layout = shared_layout(min_width='%dpx' % size[0],
+                                                  min_height='%dpx' % size[1])
+
+        if isinstance(widget, Output):
+            if isinstance(p_obj, HTMLView) and p_value:
+                p_value = HTML(p_value)
+            if self.comm_stats is not None:
+                self.comm_stats.record_display(p_name, p_value)
+            with widget:
+                # clear_output required for JLab support
+                # in future handle.update(p_value) should be sufficient
+                handle = self._display_handles.get(p_name)
+                if handle:
+                    clear_output(wait=True)
+                    handle.display(p_value)
+                else:
+                    handle = display(p_value, display_id=p_name+self._id)
+                    self._display_handles[p_name] = handle
+        else:
+            widget.value = p_value
+
+
+    def _make_widget(self, p_name):
+        p_obj = self.parameterized.params(p_name)
+        widget_class = wtype(p_obj)
+
+        value = getattr(self.parameterized, p_name)
+
+        # For ObjectSelector, pick first from objects if no default;
+        # see https://github.com/ioam/param/issues/164
+        if hasattr(p_obj,'objects') and len(p_obj.objects)>0 and value is None:
+            value = p_obj.objects[0]
+            if isinstance(p_obj,param.ListSelector):
+                value = [value]
+            setattr(self.parameterized, p_name, value)
+
+        kw = dict(value=value)
+        if p_obj.doc:
+            kw['tooltip'] = p_obj.doc
+
+        if isinstance(p_obj, param.Action):
+            def action_cb(button):
+                if self.p.recorder is not None:
+                    self.p.recorder.record('action', p_name)
+                getattr(self.parameterized, p_name)(self.parameterized)
+            kw['value'] = action_cb
+
+        kw['name'] = p_name
+
+        kw['continuous_update']=self.p.continuous_update
+
+        if hasattr(p_obj, 'callbacks'):
+            kw.pop('value', None)
+
+        if hasattr(p_obj, 'get_range'):
+            kw['options'] = named_objs(p_obj.get_range().items())
+
+        if hasattr(p_obj, 'get_soft_bounds'):
+            kw['min'], kw['max'] = p_obj.get_soft_bounds()
+
+        if getattr(p_obj, 'step', None) is not None:
+            kw['step'] = p_obj.step
+
+        if hasattr(p_obj,'is_instance') and p_obj.is_instance:
+            kw['options'][kw['value'].__class__.__name__]=kw['value']
+
+        if isinstance(widget_class, type) and issubclass(widget_class, ipywidgets.Widget):
+            w = pooled(widget_class, **kw)
+        else:
+            w = widget_class(**kw)
+
+        if isinstance(w, DropdownWithEdit):
+            w.depth = self._depth
+        self._widget_values[p_name] = value
+
+        if hasattr(p_obj, 'callbacks') and value is not None and p_name not in self._restored:
+            self._update_trait(p_name, p_obj.renderer(value), w)
+
+        def change_event(event):
+            if self._syncing == p_name:
+                return
+            new_values = event['new']
+            if self.p.recorder is not None:
+                self.p.recorder.record('change', p_name, new_values, p_obj)
+            error = False
+            # Apply literal evaluation to values
+            if (isinstance(w, ipywidgets.Text) and isinstance(p_obj, literal_params)):
+                try:
+                    with self._timer('eval', p_name):
+                        new_values = parse_literal(new_values, p_obj)
+                except:
+                    error = 'eval'
+            elif hasattr(p_obj,'is_instance') and p_obj.is_instance and isinstance(new_values,type):
+                # results in new instance each time non-default option
+                # is selected; could consider caching.
+                try:
+                    # awkward: support ParameterizedFunction
+                    with self._timer('eval', p_name):
+                        new_values = new_values.instance() if hasattr(new_values,'instance') else new_values()
+                except:
+                    error = 'instantiate'
+
+            # If no error during evaluation try to set parameter
+            if not error:
+                try:
+                    with self._timer('validate', p_name):
+                        setattr(self.parameterized, p_name, new_values)
+                    self._widget_values[p_name] = new_values
+                except ValueError:
+                    error = 'validation'
+
+            # Style widget to denote error state
+            apply_error_style(w, error)
+
+            if not error and self.p.group is not None:
+                self.p.group.dispatch(self, {p_name: new_values})
+            elif not error and not self.p.button:
+                self.execute({p_name: new_values})
+            else:
+                self._changed[p_name] = new_values
+
+        if hasattr(p_obj, 'callbacks'):
+            p_obj.callbacks[id(self.parameterized)] = functools.partial(self._update_trait, p_name)
+            if self.p.profiler is not None:
+                p_obj.profilers[id(self.parameterized)] = self.p.profiler
+            else:
+                p_obj.profilers.pop(id(self.parameterized), None)
+        else:
+            w.observe(change_event, 'value')
+
+        # Hack ; should be part of Widget classes
+        if hasattr(p_obj,"path"):
+            def path_change_event(event):
+                new_values = event['new']
+                p_obj = self.parameterized.params(p_name)
+                p_obj.path = new_values
+                p_obj.update()
+
+                # Update default value in widget, ensuring it's always a legal option
+                selector = self._widgets[p_name].children[1]
+                defaults = p_obj.default
+                if not issubclass(type(defaults),list):
+                    defaults = [defaults]
+                selector.options.update(named_objs(zip(defaults,defaults)))
+                selector.value=p_obj.default
+                selector.options=named_objs(p_obj.get_range().items())
+
+                if p_obj.objects and not self.p.button:
+                    self.execute({p_name:selector.value})
+
+            path_w = pooled(ipywidgets.Text, value=p_obj.path)
+            path_w.observe(path_change_event, 'value')
+            w = pooled(ipywidgets.VBox, children=[path_w,w],
+                       layout=shared_layout(margin='0'))
+
+        return w
+
+
+    def _sync_widget(self, p_name):
+        """
+        Shows the current value of the parameter in its widget, e.g.
+        after it was set through a link, without handling the update
+        as a change.
+        """
+        w = self._widgets.get(p_name)
+        p_obj = self.parameterized.params(p_name)
+        if w is None or hasattr(p_obj, 'callbacks') or isinstance(p_obj, param.Action):
+            return
+        if hasattr(p_obj, 'path'):
+            w = w.children[1]
+        value = getattr(self.parameterized, p_name)
+        self._widget_values[p_name] = value
+        if isinstance(w, ipywidgets.Text) and isinstance(p_obj, literal_params):
+            value = format_literal(value, isinstance(p_obj, param.Tuple))
+        self._syncing = p_name
+        try:
+            w.value = value
+        finally:
+            self._syncing = None
+        apply_error_style(w, False)
+
+
+    def refresh(self):
+        """
+        Updates the widgets of parameters whose values were changed
+        other than through the panel since they were last shown.
+        """
+        for p_name in list(self._widgets):
+            value = getattr(self.parameterized, p_name)
+            shown = self._widget_values.get(p_name)
+            try:
+                same = value is shown or bool(value == shown)
+            except Exception:
+                same = False
+            if not same:
+                self._sync_widget(p_name)
+
+
+    def close(self):
+        """
+        Closes all widgets of the panel, including any sub-object
+        editors opened from it, and detaches its View callbacks and
+        any group.
+        """
+        if self.p.group is not None:
+            self.p.group.remove(self)
+        obj_id = id(self.parameterized)
+        for p_name in self._widgets:
+            p_obj = self.parameterized.params(p_name)
+            callback = getattr(p_obj, 'callbacks', {}).get(obj_id)
+            if getattr(callback, 'func', None) == self._update_trait:
+                del p_obj.callbacks[obj_id]
+                p_obj.profilers.pop(obj_id, None)
+        for task in self._tasks.values():
+            task.cancel()
+        close_widget(self._widget_box)
+
+
+    def widget(self, param_name):
+        """Get widget for param_name"""
+        if param_name not in self._widgets:
+            self._widgets[param_name] = self._make_widget(param_name)
+        return self._widgets[param_name]
+
+
+    def execute(self, changed={}):
+        run_next_cells(self.p.next_n)
+        self._run_callback(changed)
+
+
+    def _run_callback(self, changed):
+        task = self._tasks.get('__callback__')
+        if task is not None and not task.done():
+            # The running invocation is cancelled when this one is
+            # scheduled, so its changes are passed on to this one
+            changed = dict(self._callback_changed, **changed)
+        self._callback_changed = changed
+        self._executions += 1
+        result = self._call_callback(changed)
+        if is_awaitable(result):
+            self._schedule('__callback__', result, stage='callback')
+        self._request_snapshot()
+
+
+    def _call_callback(self, changed):
+        if self.p.callback is None:
+            return None
+        if get_method_owner(self.p.callback) is self.parameterized:
+            call = functools.partial(self.p.callback, **changed)
+        else:
+            call = functools.partial(self.p.callback, self.parameterized, **changed)
+        if self.p.profiler is None:
+            return call()
+        # Coroutine callbacks are timed until completion by _schedule
+        return self.p.profiler.timed_call('callback', None, call)
+
+
+    def _timer(self, stage, key=None):
+        """
+        Returns a context manager timing the enclosed pipeline stage
+        if a profiler was supplied, otherwise a no-op.
+        """
+        profiler = self.p.profiler
+        return null_timer if profiler is None else profiler.timer(stage, key)
+
+
+    # Define some settings :)
+    preamble = """
+        <style>
+          .widget-dropdown .dropdown-menu { width: 100% }
+          .widget-select-multiple select { min-height: 100px; min-width: 300px;}
+        """ + error_css + """
+        </style>
+        """
+
+    label_format = """<div title="{2}" style="padding: 5px; width: {0};
+                      text-align: right;">{1}</div>"""
+
+    def helptip(self,obj):
+        """Return HTML code formatting a tooltip if help is available"""
+        helptext = obj.__doc__
+        return "" if (not self.p.tooltips or not helptext) else helptext
+
+
+    def widgets(self):
+        """Return name,widget boxes for all parameters (i.e., a property sheet)"""
+
+        params = self.parameterized.params().items()
+        key_fn = lambda x: x[1].precedence if x[1].precedence is not None else self.p.default_precedence
+        sorted_precedence = sorted(params, key=key_fn)
+        outputs = [k for k, p in sorted_precedence if isinstance(p, View)]
+        filtered = [(k,p) for (k,p) in sorted_precedence
+                    if ((p.precedence is None) or (p.precedence >= self.p.display_threshold))
+                    and k not in outputs]
+        groups = itertools.groupby(filtered, key=key_fn)
+        sorted_groups = [sorted(grp) for (k,grp) in groups]
+        ordered_params = [el[0] for group in sorted_groups for el in group]
+
+        # Format name specially
+        widgets = [pooled(ipywidgets.HTML, value=self.preamble +
+            '<div class="ttip"><b>{0}</b>'.format(self.parameterized.name)+"</div>")]
+
+        label_width=self.p.label_width
+        if callable(label_width):
+            label_width = label_width(self.parameterized.params().keys())
+
+        def format_name(pname):
+            p = self.parameterized.params(pname)
+            # omit name for buttons, which already show the name on the button
+            name = "" if issubclass(type(p),param.Action) else pname
+            return pooled(ipywidgets.HTML, value=self.label_format.format(label_width, name, self.helptip(p)))
+
+        if self.p.show_labels:
+            widgets += [pooled(ipywidgets.HBox, children=[format_name(pname),self.widget(pname)])
+                        for pname in ordered_params]
+        else:
+            widgets += [self.widget(pname) for pname in ordered_params]
+
+        if self.p.close_button:
+            close_button = pooled(ipywidgets.Button, description="Close")
+            close_button.on_click(lambda _: self.close())
+            widgets.append(close_button)
+
+
+        if self.p.button and not (self.p.callback is None and self.p.next_n==0):
+            label = 'Run %s' % self.p.next_n if self.p.next_n != 'all' else "Run"
+            display_button = pooled(ipywidgets.Button, description=label)
+            def click_cb(button):
+                if self.p.recorder is not None:
+                    self.p.recorder.record('click')
+                # Execute and clear changes since last button press
+                try:
+                    self.execute(self._changed)
+                except Exception as e:
+                    self._changed.clear()
+                    raise e
+                self._changed.clear()
+            display_button.on_click(click_cb)
+            widgets.append(display_button)
+            self._run_button = display_button
+
+        outputs = OrderedDict([(pname, self.widget(pname)) for pname in outputs])
+        return widgets, outputs
+
+
+def sub_editor(parameterized, depth=1):
+    """
+    Returns an undisplayed Widgets panel with a close button for
+    editing a sub-object at the given nesting depth, as shown by
+    DropdownWithEdit.
+    """
+    panel = Widgets.instance()
+    panel._setup(parameterized, close_button=True)
+    panel._depth = depth
+    panel._build([], show=False)
+    return panel
+
+
+# TODO: this is awkward. An alternative would be to import Widgets in
+# widgets.py only at the point(s) where Widgets is needed rather than
+# at the top level (to avoid circular imports). Probably some
+# reorganization would be better, though.
+widgets.editor = sub_editor
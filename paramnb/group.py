@@ -0,0 +1,138 @@
+"""
+Groups of Widgets panels with linked parameters, whose changes are
+handled by a single dispatcher.
+"""
+from __future__ import absolute_import
+
+import functools
+from collections import OrderedDict
+
+import param
+
+
+class PanelGroup(param.Parameterized):
+    """
+    Dispatcher shared by several Widgets panels, supplied as their
+    group. Parameters linked across the Parameterized objects of the
+    panels are kept in sync, and a change is handled as a whole: the
+    linked values are applied first, cells are run once and then each
+    affected panel executes its callback once with all of its changed
+    parameters.
+
+    Upstream work needed by several callbacks, e.g. loading data for
+    a shared time range, can be wrapped with the shared decorator so
+    it is computed once per change.
+    """
+
+    def __init__(self, **params):
+        super(PanelGroup, self).__init__(**params)
+        self.members = []
+        self._links = []
+        self._pending = OrderedDict()
+        self._results = {}
+        self._dispatching = False
+
+    def add(self, widgets):
+        """
+        Adds a Widgets panel to the group, replacing any earlier panel
+        for the same Parameterized object, e.g. when a cell is re-run.
+        """
+        self.members = [m for m in self.members
+                        if m.parameterized is not widgets.parameterized] + [widgets]
+
+    def remove(self, widgets):
+        "Removes a Widgets panel from the group, e.g. once closed."
+        self.members = [m for m in self.members if m is not widgets]
+        self._pending.pop(widgets, None)
+
+    def link(self, *targets):
+        """
+        Links parameters so that changing one sets all others. Targets
+        are (parameterized, name) tuples, or names of parameters linked
+        across every member declaring them.
+        """
+        self._links.append(list(targets))
+
+    def shared(self, fn):
+        """
+        Decorator caching the results of fn by its (hashable)
+        arguments for the duration of a single dispatch.
+        """
+        @functools.wraps(fn)
+        def wrapper(*args, **kw):
+            key = (fn, args, tuple(sorted(kw.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kw)
+            if not self._dispatching:
+                return fn(*args, **kw)
+            if key not in self._results:
+                self._results[key] = fn(*args, **kw)
+            return self._results[key]
+        return wrapper
+
+    def _linked(self, obj, name):
+        "Returns the (parameterized, name) targets linked to a parameter."
+        linked = []
+        for link in self._links:
+            targets = []
+            for target in link:
+                if isinstance(target, tuple):
+                    targets.append(target)
+                else:
+                    targets += [(m.parameterized, target) for m in self.members
+                                if target in m.parameterized.params()]
+            if any(o is obj and n == name for o, n in targets):
+                linked += [(o, n) for o, n in targets if not (o is obj and n == name)]
+        return linked
+
+    def _merge(self, member, changed):
+        self._pending.setdefault(member, {}).update(changed)
+
+    def dispatch(self, member, changed):
+        """
+        Handles the changed parameter values of a member, propagating
+        them along the links and executing every affected member once.
+        """
+        self._merge(member, changed)
+        queue = [(member.parameterized, k, v) for k, v in changed.items()]
+        seen = set((id(member.parameterized), k) for k in changed)
+        while queue:
+            obj, name, value = queue.pop(0)
+            for target, pname in self._linked(obj, name):
+                if (id(target), pname) in seen:
+                    continue
+                seen.add((id(target), pname))
+                try:
+                    setattr(target, pname, value)
+                except ValueError as e:
+                    self.warning('Could not link %r to %r: %s' % (name, pname, e))
+                    continue
+                for m in self.members:
+                    if m.parameterized is target:
+                        m._sync_widget(pname)
+                        self._merge(m, {pname: value})
+                queue.append((target, pname, value))
+
+        if self._dispatching:
+            # Picked up by the dispatch already in progress
+            return
+        self._dispatching = True
+        try:
+            next_n = [m.p.next_n for m in self._pending if m.p.next_n and not m.p.button]
+            if next_n:
+                from .core import run_next_cells
+                run_next_cells(next_n[0])
+            # Callbacks changing linked widgets queue up another batch
+            while self._pending:
+                batch, self._pending = self._pending, OrderedDict()
+                for m, member_changed in batch.items():
+                    if m.p.button:
+                        m._changed.update(member_changed)
+                    else:
+                        m._run_callback(member_changed)
+        finally:
+            self._pending.clear()
+            self._results.clear()
+            self._dispatching = False
@@ -0,0 +1,160 @@
+"""
+Initialization of Parameter values from a JSON specification.
+"""
+from __future__ import absolute_import
+
+import os
+import copy
+import json
+
+import param
+
+
+class JSONInit(param.Parameterized):
+    """
+    Callable that can be passed to Widgets.initializer to set Parameter
+    values using JSON. There are three approaches that may be used:
+
+    1. If the json_file argument is specified, this takes precedence.
+    2. The JSON file path can be specified via an environment variable.
+    3. The JSON can be read directly from an environment variable.
+
+    Here is an easy example of setting such an environment variable on
+    the commandline:
+
+    PARAMNB_INIT='{"p1":5}' jupyter notebook
+
+    This addresses any JSONInit instances that are inspecting the
+    default environment variable called PARAMNB_INIT, instructing it to set
+    the 'p1' parameter to 5.
+    """
+
+    varname = param.String(default='PARAMNB_INIT', doc="""
+        The name of the environment variable containing the JSON
+        specification.""")
+
+    target = param.String(default=None, doc="""
+        Optional key in the JSON specification dictionary containing the
+        desired parameter values.""")
+
+    json_file = param.String(default=None, doc="""
+        Optional path to a JSON file containing the parameter settings.""")
+
+
+    def __call__(self, parameterized):
+
+        warnobj = param.main if isinstance(parameterized, type) else parameterized
+        param_class = (parameterized if isinstance(parameterized, type)
+                       else parameterized.__class__)
+
+
+        target = self.target if self.target is not None else param_class.__name__
+
+        env_var = os.environ.get(self.varname, None)
+        if env_var is None and self.json_file is None: return
+
+        if self.json_file or env_var.endswith('.json'):
+            fname = self.json_file if self.json_file else env_var
+            try:
+                spec = load_file(fname)
+            except Exception as e:
+                warnobj.warning('Could not load JSON file %r: %s' % (fname, e))
+                return
+        else:
+            try:
+                spec = load_string(env_var)
+            except ValueError as e:
+                warnobj.warning('Could not parse JSON in %s: %s' % (self.varname, e))
+                return
+
+        if spec is None:
+            warnobj.warning('JSON parameter specification must be a dictionary.')
+            return
+
+        params = spec.params(target)
+        if not params:
+            return
+
+        known = parameterized.params()
+        for name in [name for name in params if name not in known]:
+            warnobj.warning('JSON specification sets %r, which is not a '
+                            'parameter of %s.' % (name, param_class.__name__))
+        # Copied so objects do not share mutable values with the cache
+        params = {name: copy.deepcopy(value) for name, value in params.items()
+                  if name in known}
+
+        # Apply all values in a single batch, falling back to setting
+        # them one by one to report exactly which keys are invalid
+        try:
+            parameterized.set_param(**params)
+        except ValueError:
+            for name, value in params.items():
+                try:
+                    parameterized.set_param(**{name: value})
+                except ValueError as e:
+                    warnobj.warning('Could not set %r from JSON specification: %s' % (name, e))
+
+
+class _Spec(object):
+    """
+    Parsed JSON specification, indexing the parameter values by
+    target class name. Values for targets not found in the
+    specification default to the whole specification.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self._index = {}
+
+    def params(self, target):
+        "Returns the parameter values for the target."
+        if target not in self._index:
+            self._index[target] = self.spec[target] if target in self.spec else self.spec
+        return self._index[target]
+
+
+# Process-wide cache of parsed specifications, keyed by absolute
+# filename (together with its mtime and size) or by the JSON string
+_cache = {}
+
+
+def clear_cache():
+    "Clears the cache of parsed JSON specifications."
+    _cache.clear()
+
+
+def _parse(text):
+    spec = json.loads(text)
+    return _Spec(spec) if isinstance(spec, dict) else None
+
+
+def load_string(text):
+    """
+    Returns the parsed specification for the JSON string, or None if
+    it is not a dictionary, reusing the result of earlier calls.
+    """
+    key = ('string', text)
+    if key not in _cache:
+        # Only the most recent string is kept, e.g. the environment variable
+        for old in [k for k in _cache if k[0] == 'string']:
+            del _cache[old]
+        _cache[key] = _parse(text)
+    return _cache[key]
+
+
+def load_file(fname):
+    """
+    Returns the parsed specification in the JSON file, or None if it
+    is not a dictionary. The file is only read again once its
+    modification time or size changes.
+    """
+    fname = os.path.abspath(fname)
+    stat = os.stat(fname)
+    stamp = (stat.st_mtime, stat.st_size)
+    cached = _cache.get(('file', fname))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(fname, 'r') as f:
+        spec = _parse(f.read())
+    _cache[('file', fname)] = (stamp, spec)
+    return spec
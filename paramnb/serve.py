@@ -0,0 +1,402 @@
+"""
+Standalone web app serving a Parameterized class to many concurrent
+users without a notebook kernel per user, e.g.:
+
+    paramnb serve mymodule:MyParameterized --callback update
+
+Each browser session gets its own instance of the class. The callback
+and View renderers of all sessions run on one bounded pool of worker
+threads, and rendered outputs are shared between sessions through a
+cache keyed by the parameter values. Sessions idle for longer than
+idle_timeout are discarded.
+"""
+from __future__ import absolute_import
+
+import copy
+import json
+import time
+import uuid
+import base64
+import argparse
+import importlib
+import threading
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+try:
+    from html import escape
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs
+    from http.cookies import SimpleCookie
+except ImportError: # Python 2
+    from cgi import escape
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs
+    from Cookie import SimpleCookie
+
+import param
+
+from .util import named_objs, resolve
+from .view import View, HTML as HTMLView, Image as ImageView
+from .sweep import settings_key
+from .widgets import parse_literal, format_literal, literal_params
+
+
+def load_target(spec):
+    """
+    Returns the Parameterized class or instance named by a
+    'module:name' specification.
+    """
+    module, _, name = spec.partition(':')
+    if not name:
+        raise ValueError("Expected 'module:ParameterizedClass', got %r" % spec)
+    return getattr(importlib.import_module(module), name)
+
+
+def render_html(p_obj, value):
+    "Returns HTML displaying the rendered value of a View parameter."
+    if isinstance(value, tuple):
+        value, size = value
+    if value is None:
+        return ''
+    # On Python 2, bytes is str, i.e. plain text is not PNG data
+    if isinstance(p_obj, ImageView) or (isinstance(value, bytes) and not isinstance(value, str)):
+        return '<img src="data:image/png;base64,%s">' % base64.b64encode(value).decode('ascii')
+    if isinstance(p_obj, HTMLView):
+        return value
+    if hasattr(value, '_repr_html_'):
+        return value._repr_html_()
+    if hasattr(value, '_repr_png_'):
+        return render_html(ImageView(), value._repr_png_())
+    return '<pre>%s</pre>' % escape(repr(value))
+
+
+class Session(object):
+    "State of one browser session."
+
+    def __init__(self, parameterized):
+        self.parameterized = parameterized
+        self.lock = threading.Lock()
+        self.last_access = time.time()
+        self.outputs = {}
+
+
+class PanelServer(param.Parameterized):
+    """
+    Serves an HTML form for the parameters of a Parameterized class,
+    with one instance per browser session, sharing a bounded worker
+    pool and a cache of rendered outputs between all sessions.
+    """
+
+    target = param.Parameter(default=None, doc="""
+        The Parameterized class (or instance to copy) to serve.""")
+
+    callback = param.String(default=None, allow_None=True, doc="""
+        Name of a method of the target executed whenever a value
+        changes, as for the Widgets callback.""")
+
+    workers = param.Integer(default=4, bounds=(1, None), doc="""
+        Number of threads executing callbacks and renderers.""")
+
+    cache_size = param.Integer(default=256, bounds=(0, None), doc="""
+        Number of rendered outputs kept in the shared cache. Caching
+        assumes the callback and renderers only depend on the
+        parameter values; zero disables the cache.""")
+
+    idle_timeout = param.Number(default=600, bounds=(0, None), doc="""
+        Seconds after which an inactive session is discarded.""")
+
+    def __init__(self, **params):
+        super(PanelServer, self).__init__(**params)
+        self.sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._pool = ThreadPool(self.workers)
+
+    def _new_instance(self):
+        if isinstance(self.target, type):
+            return self.target()
+        return copy.deepcopy(self.target)
+
+    def session(self, sid):
+        "Returns the session with the supplied id, creating it if needed."
+        with self._sessions_lock:
+            session = self.sessions.get(sid)
+            if session is None:
+                session = self.sessions[sid] = Session(self._new_instance())
+        session.last_access = time.time()
+        return session
+
+    def reap(self):
+        "Discards sessions idle for longer than idle_timeout."
+        cutoff = time.time() - self.idle_timeout
+        with self._sessions_lock:
+            for sid in [s for s, session in self.sessions.items()
+                        if session.last_access < cutoff]:
+                del self.sessions[sid]
+
+    def _params(self, obj):
+        "Returns the displayed (name, parameter) pairs in order, as Widgets."
+        key_fn = lambda x: x[1].precedence if x[1].precedence is not None else 1e-8
+        return [(k, p) for k, p in sorted(obj.params().items(), key=lambda x: (key_fn(x), x[0]))
+                if k != 'name' and (p.precedence is None or p.precedence >= 0)]
+
+    def _values(self, obj):
+        "Returns the values of all parameters the outputs may depend on."
+        return {k: getattr(obj, k) for k, p in obj.params().items()
+                if k != 'name' and not isinstance(p, (View, param.Action))}
+
+    def _compute(self, obj, changed):
+        "Returns the View values and rendered outputs after the callback."
+        if self.callback:
+            resolve(getattr(obj, self.callback)(**changed))
+        views = {k: getattr(obj, k) for k, p in obj.params().items()
+                 if isinstance(p, View)}
+        outputs = {k: render_html(obj.params(k), resolve(obj.params(k).renderer(v)))
+                   for k, v in views.items() if v is not None}
+        return views, outputs
+
+    def outputs(self, session, changed={}, cached=True):
+        """
+        Returns the rendered View outputs for the current values of the
+        session's object, from the cache or computed on the pool.
+        """
+        obj = session.parameterized
+        key = settings_key(self._values(obj)) if self.cache_size and cached else None
+        if key is not None:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    # Move to the end, i.e. mark as most recently used
+                    self._cache[key] = self._cache.pop(key)
+            if entry is not None:
+                # The callback is skipped, so the View values it would
+                # have set are applied for the next, uncached, change
+                views, outputs = entry
+                for k, v in views.items():
+                    setattr(obj, k, v)
+                return outputs
+        views, outputs = self._pool.apply(self._compute, (obj, changed))
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = (views, outputs)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return outputs
+
+    def update(self, session, form):
+        """
+        Applies the submitted form values to the session's object,
+        returning the rendered outputs and any errors by parameter.
+        """
+        obj, changed, errors = session.parameterized, {}, {}
+        with session.lock:
+            params = dict(self._params(obj))
+            for name, value in form.items():
+                if name == '__action__':
+                    continue
+                p_obj = params.get(name)
+                if p_obj is None or p_obj.constant or isinstance(p_obj, (View, param.Action)):
+                    continue
+                try:
+                    value = self._decode(p_obj, value)
+                    if value != getattr(obj, name):
+                        setattr(obj, name, value)
+                        changed[name] = value
+                except Exception as e:
+                    errors[name] = str(e)
+            action = form.get('__action__')
+            if isinstance(params.get(action), param.Action):
+                getattr(obj, action)(obj)
+            else:
+                action = None
+            if changed or action or not session.outputs:
+                # Actions may change state not captured by the values
+                session.outputs = self.outputs(session, changed, cached=not action)
+        return dict(views=session.outputs, errors=errors)
+
+    @staticmethod
+    def _decode(p_obj, value):
+        if isinstance(p_obj, param.ListSelector):
+            options = named_objs(p_obj.get_range().items())
+            return [options[v] for v in (value if isinstance(value, list) else [value])]
+        if isinstance(value, list):
+            value = value[-1]
+        if hasattr(p_obj, 'get_range'):
+            return named_objs(p_obj.get_range().items())[value]
+        if isinstance(p_obj, param.Boolean):
+            return value in ('on', 'true', 'True', True)
+        if isinstance(p_obj, param.Integer):
+            return int(value)
+        if isinstance(p_obj, param.Number):
+            return float(value)
+        if isinstance(p_obj, literal_params):
+            return parse_literal(value, p_obj)
+        return value
+
+    def _input(self, name, p_obj, value):
+        attrs = 'name="%s" id="%s"%s' % (name, name, ' disabled' if p_obj.constant else '')
+        if isinstance(p_obj, param.Action):
+            return '<button type="button" data-action="%s">%s</button>' % (name, escape(name))
+        if hasattr(p_obj, 'get_range'):
+            options = named_objs(p_obj.get_range().items())
+            multiple = isinstance(p_obj, param.ListSelector)
+            selected = value if multiple else [value]
+            return '<select %s%s>%s</select>' % (attrs, ' multiple' if multiple else '', ''.join(
+                '<option%s>%s</option>' % (' selected' if v in selected else '', escape(k))
+                for k, v in options.items()))
+        if isinstance(p_obj, param.Boolean):
+            return ('<input type="hidden" name="%s" value="false">'
+                    '<input type="checkbox" %s%s>' % (name, attrs, ' checked' if value else ''))
+        if isinstance(p_obj, param.Number) and None not in p_obj.get_soft_bounds():
+            lower, upper = p_obj.get_soft_bounds()
+            step = p_obj.step or (1 if isinstance(p_obj, param.Integer) else 0.1)
+            return ('<input type="range" %s min="%s" max="%s" step="%s" value="%s" '
+                    'oninput="this.nextSibling.value=this.value"><output>%s</output>'
+                    % (attrs, lower, upper, step, value, value))
+        if isinstance(p_obj, literal_params):
+            value = format_literal(value, isinstance(p_obj, param.Tuple))
+        return '<input type="text" %s value="%s">' % (attrs, escape(str(value), quote=True))
+
+    page_template = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+  body {{ font-family: sans-serif; display: flex; gap: 2em; }}
+  label {{ display: inline-block; width: 10em; text-align: right; padding: 5px; }}
+  .paramnb-error {{ border: 5px solid #cc0000 }}
+</style></head>
+<body><form id="params"><h3>{title}</h3>{rows}</form><div>{views}</div>
+<script>
+var form = document.getElementById('params');
+function update(action) {{
+  var data = new URLSearchParams(new FormData(form));
+  if (action) data.append('__action__', action);
+  fetch('update', {{method: 'POST', body: data}}).then(r => r.json()).then(function(result) {{
+    for (var name in result.views)
+      document.getElementById('view-' + name).innerHTML = result.views[name];
+    for (var el of form.elements) el.classList.toggle('paramnb-error', el.name in result.errors);
+  }});
+}}
+form.addEventListener('change', function() {{ update(); }});
+form.addEventListener('submit', function(e) {{ e.preventDefault(); update(); }});
+for (var b of form.querySelectorAll('[data-action]'))
+  b.addEventListener('click', function() {{ update(this.dataset.action); }});
+</script></body></html>"""
+
+    def page(self, session):
+        "Returns the HTML page for the session."
+        obj = session.parameterized
+        with session.lock:
+            if not session.outputs:
+                session.outputs = self.outputs(session)
+        rows, views = [], []
+        for name, p_obj in self._params(obj):
+            if isinstance(p_obj, View):
+                views.append('<div id="view-%s">%s</div>' % (name, session.outputs.get(name, '')))
+            else:
+                label = '' if isinstance(p_obj, param.Action) else escape(name)
+                rows.append('<div><label for="%s" title="%s">%s</label>%s</div>' % (
+                    name, escape(p_obj.doc or '', quote=True), label,
+                    self._input(name, p_obj, getattr(obj, name))))
+        return self.page_template.format(title=escape(type(obj).__name__),
+                                         rows=''.join(rows), views=''.join(views))
+
+    def make_server(self, host='127.0.0.1', port=5006):
+        "Returns an HTTP server for this panel, not yet serving."
+        return _HTTPServer((host, port), _Handler, self)
+
+    def serve(self, host='127.0.0.1', port=5006):
+        "Serves the panel until interrupted, reaping idle sessions."
+        server = self.make_server(host, port)
+        interval = max(1, min(60, self.idle_timeout / 2.))
+        def reaper():
+            while True:
+                time.sleep(interval)
+                self.reap()
+        thread = threading.Thread(target=reaper)
+        thread.daemon = True
+        thread.start()
+        print('Serving %s on http://%s:%d' % (type(self._new_instance()).__name__,
+                                              host, server.server_address[1]))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self._pool.close()
+            self._pool.join()
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, address, handler, panel):
+        self.panel = panel
+        HTTPServer.__init__(self, address, handler)
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    cookie = 'paramnb_session'
+
+    def _session(self):
+        cookies = SimpleCookie(self.headers.get('Cookie', ''))
+        sid = cookies[self.cookie].value if self.cookie in cookies else None
+        if sid is None or sid not in self.server.panel.sessions:
+            sid = uuid.uuid4().hex
+        return sid, self.server.panel.session(sid)
+
+    def _send(self, body, content_type, sid):
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', '%s=%s; Path=/; HttpOnly' % (self.cookie, sid))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/':
+            self.send_error(404)
+            return
+        sid, session = self._session()
+        self._send(self.server.panel.page(session), 'text/html; charset=utf-8', sid)
+
+    def do_POST(self):
+        if self.path != '/update':
+            self.send_error(404)
+            return
+        sid, session = self._session()
+        length = int(self.headers.get('Content-Length', 0))
+        form = {k: v if len(v) > 1 else v[0] for k, v in
+                parse_qs(self.rfile.read(length).decode('utf-8'), keep_blank_values=True).items()}
+        result = self.server.panel.update(session, form)
+        self._send(json.dumps(result), 'application/json', sid)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='paramnb serve', description="""
+        Serve the parameters and View outputs of a Parameterized
+        class as a web app, with one instance per browser session.""")
+    parser.add_argument('target', help="the class to serve, as 'module:ParameterizedClass'")
+    parser.add_argument('--callback', help='name of a method to execute when a value changes')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5006)
+    for name in ['workers', 'cache_size', 'idle_timeout']:
+        p_obj = PanelServer.params(name)
+        parser.add_argument('--' + name.replace('_', '-'), default=p_obj.default,
+                            type=int if isinstance(p_obj, param.Integer) else float,
+                            help=' '.join(p_obj.doc.split()))
+    args = parser.parse_args(args)
+    panel = PanelServer(target=load_target(args.target), callback=args.callback,
+                        workers=args.workers, cache_size=args.cache_size,
+                        idle_timeout=args.idle_timeout)
+    panel.serve(args.host, args.port)
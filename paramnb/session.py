@@ -0,0 +1,171 @@
+"""
+Recording of widget interaction sessions and headless replay of the
+recorded logs, e.g. for load testing callbacks and renderers.
+"""
+from __future__ import absolute_import
+
+import gzip
+import json
+import time
+
+import param
+
+from .timing import clock
+from .util import named_objs
+
+
+def _open(filename, mode):
+    if filename.endswith('.gz'):
+        return gzip.open(filename, mode + 't')
+    return open(filename, mode)
+
+
+def _labels(p_obj):
+    "Returns a mapping from object to label for a Selector parameter."
+    return {id(v): k for k, v in named_objs(p_obj.get_range().items()).items()}
+
+
+class Recorder(param.Parameterized):
+    """
+    Records the changes and button clicks of a Widgets session,
+    timestamped relative to the first event. Supply an instance as
+    the recorder of Widgets and save the log once done.
+
+    The log is stored as JSON lines, a header followed by one
+    [time, event, name, value] list per event, where event is one of
+    'change' (a widget value changed), 'action' (an Action button was
+    pressed) or 'click' (the Run button was pressed). Selector values
+    are stored as the labels of the selected options.
+    """
+
+    def __init__(self, **params):
+        super(Recorder, self).__init__(**params)
+        self.events = []
+        self.target = None
+        self._start = None
+
+    def record(self, event, name=None, value=None, p_obj=None):
+        "Records an event, encoding the value for the parameter."
+        now = clock()
+        if self._start is None:
+            self._start = now
+        if p_obj is not None and hasattr(p_obj, 'get_range'):
+            labels = _labels(p_obj)
+            if isinstance(value, (list, tuple)):
+                value = {'labels': [labels.get(id(v), str(v)) for v in value]}
+            else:
+                value = {'label': labels.get(id(value), str(value))}
+        self.events.append([round(now - self._start, 6), event, name, value])
+
+    def save(self, filename):
+        "Saves the log, compressed if the filename ends in .gz."
+        with _open(filename, 'w') as f:
+            f.write(json.dumps({'paramnb_session': 1, 'target': self.target}) + '\n')
+            for event in self.events:
+                f.write(json.dumps(event, separators=(',', ':'), default=str) + '\n')
+
+    @classmethod
+    def load(cls, filename):
+        "Returns a Recorder holding the events of a saved log."
+        recorder = cls()
+        with _open(filename, 'r') as f:
+            header = json.loads(f.readline())
+            recorder.target = header.get('target')
+            recorder.events = [json.loads(line) for line in f if line.strip()]
+        return recorder
+
+
+class ReplayReport(object):
+    """
+    Latencies of the replayed events, i.e. the time taken to handle
+    each change or click including the callback and View rendering.
+    Coroutine callbacks and renderers are only scheduled, so their
+    latency is not included.
+    """
+
+    def __init__(self, events, latencies, elapsed):
+        self.events = events
+        self.latencies = latencies
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return ('ReplayReport(events=%d, elapsed=%.3fs, throughput=%.1f/s, '
+                'mean=%.2fms, p95=%.2fms, max=%.2fms)' % (
+                    len(self.latencies), self.elapsed, self.throughput,
+                    self.mean*1000, self.percentile(95)*1000,
+                    max(self.latencies or [0])*1000))
+
+    @property
+    def throughput(self):
+        "Events handled per second."
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.
+
+    @property
+    def mean(self):
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.
+
+    def percentile(self, q):
+        "Returns the latency at the q-th percentile."
+        if not self.latencies:
+            return 0.
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered)-1, int(len(ordered)*q/100.))]
+
+
+class Replay(param.ParameterizedFunction):
+    """
+    Replays a recorded session against a Parameterized object by
+    driving the widgets of a Widgets panel which is built but not
+    displayed, so the same evaluation, validation, callback and
+    rendering code runs as in the notebook. Any additional keyword
+    arguments are passed to Widgets, e.g. to compare execution modes
+    or to supply a Profiler for a per-stage breakdown. Any initializer
+    is run first, as by Widgets.
+    """
+
+    speed = param.Number(default=1.0, allow_None=True, bounds=(0, None), doc="""
+        Replay speed relative to the recording, e.g. 10 replays ten
+        times faster. None replays the events back to back.""")
+
+    def __call__(self, log, parameterized, **params):
+        from .core import Widgets
+        speed = params.pop('speed', self.speed)
+        recorder = log if isinstance(log, Recorder) else Recorder.load(log)
+
+        widgets = Widgets.instance()
+        widgets._setup(parameterized, **params)
+        widgets._initialize([], show=False)
+        if '__initializer__' in widgets._tasks:
+            raise ValueError('Replay cannot wait for a coroutine initializer '
+                             'within a running event loop.')
+
+        latencies = []
+        start = clock()
+        for t, event, name, value in recorder.events:
+            if speed:
+                delay = t/float(speed) - (clock() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            before = clock()
+            if event == 'change':
+                p_obj = parameterized.params(name)
+                widgets.widget(name).value = self._decode(p_obj, value)
+            elif event == 'action':
+                widgets.widget(name).click()
+            elif event == 'click' and widgets._run_button is not None:
+                widgets._run_button.click()
+            elif event == 'click':
+                # Recorded with button=True but replayed without
+                widgets.execute(widgets._changed)
+                widgets._changed.clear()
+            latencies.append(clock() - before)
+        return ReplayReport(recorder.events, latencies, clock() - start)
+
+    @staticmethod
+    def _decode(p_obj, value):
+        if isinstance(value, dict) and hasattr(p_obj, 'get_range'):
+            options = named_objs(p_obj.get_range().items())
+            if 'labels' in value:
+                return [options[label] for label in value['labels']]
+            return options[value['label']]
+        return value
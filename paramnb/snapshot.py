@@ -0,0 +1,119 @@
+"""
+Snapshots of the rendered View outputs of a Widgets panel, allowing a
+panel to be shown at once when reopened with the same values.
+"""
+from __future__ import absolute_import
+
+import os
+import glob
+import pickle
+import hashlib
+import inspect
+import tempfile
+
+import param
+
+from .view import View
+
+
+def class_hash(cls):
+    """
+    Returns a hash of the source code of the supplied Parameterized
+    class and its Parameterized superclasses, falling back to the
+    declared parameters if the source is unavailable.
+    """
+    sha = hashlib.sha1()
+    for c in inspect.getmro(cls):
+        if c in (param.Parameterized, param.ParameterizedFunction) or not issubclass(c, param.Parameterized):
+            continue
+        try:
+            source = inspect.getsource(c)
+        except (IOError, OSError, TypeError):
+            source = repr(sorted((k, type(p).__name__, repr(p.default))
+                                 for k, p in c.params().items()))
+        sha.update(source.encode('utf-8'))
+    return sha.hexdigest()[:16]
+
+
+def values_hash(parameterized):
+    """
+    Returns a hash of the values of all parameters other than Views
+    and Actions, i.e. of the inputs determining the rendered outputs.
+    """
+    sha = hashlib.sha1()
+    for k, p in sorted(parameterized.params().items()):
+        if k == 'name' or isinstance(p, (View, param.Action)):
+            continue
+        value = getattr(parameterized, k)
+        if isinstance(value, int) and not isinstance(value, bool):
+            # Sliders may supply 3.0 for 3
+            value = float(value)
+        try:
+            data = pickle.dumps(value, 2)
+        except Exception:
+            data = repr(value).encode('utf-8')
+        sha.update(k.encode('utf-8'))
+        sha.update(data)
+    return sha.hexdigest()[:16]
+
+
+def _prefix(directory, parameterized):
+    cls = parameterized if isinstance(parameterized, type) else type(parameterized)
+    return os.path.join(directory, '%s.%s-%s' % (cls.__module__, cls.__name__, class_hash(cls)))
+
+
+def snapshot_path(directory, parameterized):
+    """
+    Returns the snapshot file for the class of the parameterized
+    object and its current parameter values.
+    """
+    return '%s-%s.pkl' % (_prefix(directory, parameterized), values_hash(parameterized))
+
+
+def save_snapshot(directory, parameterized, outputs, limit=16):
+    """
+    Saves the picklable rendered View outputs for the current values
+    of the parameterized object, replacing the file atomically. Only
+    the limit most recently saved snapshots of a class are kept.
+    """
+    # Each output is pickled once, skipping those that cannot be
+    blobs = {}
+    for name, output in outputs.items():
+        try:
+            blobs[name] = pickle.dumps(output, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            continue
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    path = snapshot_path(directory, parameterized)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(blobs, f, pickle.HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(tmp, path)
+    except Exception:
+        os.remove(tmp)
+        raise
+
+    saved = sorted(glob.glob(_prefix(directory, parameterized) + '-*.pkl'),
+                   key=os.path.getmtime)
+    for old in saved[:-limit]:
+        os.remove(old)
+    return path
+
+
+def load_snapshot(directory, parameterized):
+    """
+    Returns the rendered View outputs saved for the current values of
+    the parameterized object, or None if there is no readable
+    snapshot.
+    """
+    path = snapshot_path(directory, parameterized)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            blobs = pickle.load(f)
+        return {name: pickle.loads(blob) for name, blob in blobs.items()}
+    except Exception:
+        return None
@@ -0,0 +1,169 @@
+"""
+Accounting of the comm traffic generated by a Widgets panel.
+"""
+import json
+from collections import Counter
+from contextlib import contextmanager
+
+import ipywidgets
+from IPython.core.interactiveshell import InteractiveShell
+
+try:
+    from ipywidgets.widgets.widget import _remove_buffers
+except ImportError:
+    def _remove_buffers(state):
+        return state, [], []
+
+
+def message_size(msg, buffers=None):
+    """
+    Returns the approximate number of bytes a comm message occupies
+    on the websocket, i.e. its JSON encoding plus any binary buffers.
+    """
+    size = len(json.dumps(msg, default=str, separators=(',', ':')))
+    for buf in buffers or []:
+        size += memoryview(buf).nbytes
+    return size
+
+
+def iter_models(widget):
+    """
+    Yields the supplied widget and every model it references, e.g.
+    layouts, styles, children and the internals of composite widgets.
+    """
+    seen, stack = set(), [widget]
+    while stack:
+        w = stack.pop()
+        if not isinstance(w, ipywidgets.Widget) or id(w) in seen:
+            continue
+        seen.add(id(w))
+        yield w
+        composite = getattr(w, '_composite', None)
+        if composite is not None:
+            stack.append(composite)
+        for key in w.keys:
+            value = getattr(w, key, None)
+            if isinstance(value, (list, tuple)):
+                stack.extend(value)
+            else:
+                stack.append(value)
+
+
+class CommStats(object):
+    """
+    Counts the comm models opened and the messages and bytes sent to
+    and received from the frontend. All counts are broken down by key,
+    which is the name of the parameter (or View) a model belongs to,
+    'shared' for the layout and style models shared with other
+    widgets (and panels), or None for models making up the rest of
+    the panel.
+    """
+
+    def __init__(self):
+        # Models tracked by this object, by id
+        self._seen = {}
+        self.models = Counter()
+        self.sent = Counter()
+        self.sent_bytes = Counter()
+        self.received = Counter()
+        self.received_bytes = Counter()
+
+    _counters = ['models', 'sent', 'sent_bytes', 'received', 'received_bytes']
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(
+            '%s=%d' % (c, n) for c, n in self.totals().items()))
+
+    def totals(self):
+        "Returns the total of each count across all keys."
+        return {c: sum(getattr(self, c).values()) for c in self._counters}
+
+    def reset(self):
+        "Resets all counts to zero."
+        for c in self._counters:
+            getattr(self, c).clear()
+
+    def copy(self):
+        stats = type(self)()
+        for c in self._counters:
+            getattr(stats, c).update(getattr(self, c))
+        return stats
+
+    def record_sent(self, key, msg, buffers=None):
+        self.sent[key] += 1
+        self.sent_bytes[key] += message_size(msg, buffers)
+
+    def record_received(self, key, msg):
+        self.received[key] += 1
+        self.received_bytes[key] += message_size(msg)
+
+    def record_display(self, key, obj):
+        """
+        Accounts for displaying obj in an Output widget, which is sent
+        to the frontend as a display message rather than over the
+        widget's comm.
+        """
+        if InteractiveShell.initialized():
+            data, metadata = InteractiveShell.instance().display_formatter.format(obj)
+        else:
+            data, metadata = {'text/plain': repr(obj)}, {}
+        self.record_sent(key, dict(data=data, metadata=metadata))
+
+    def track(self, widget, key=None):
+        """
+        Starts accounting for the comm traffic of the widget and all
+        models it references. The opening message of each model is
+        estimated from its current state, since it has already been
+        sent when the widget is created.
+        """
+        from .widgets import shared_models
+        shared = shared_models()
+        for model in iter_models(widget):
+            if id(model) in self._seen:
+                continue
+            self._seen[id(model)] = model
+            model_key = 'shared' if id(model) in shared else key
+            self.models[model_key] += 1
+            state, buffer_paths, buffers = _remove_buffers(model.get_state())
+            self.record_sent(model_key, dict(state=state, buffer_paths=buffer_paths), buffers)
+            self._listen(model, model_key)
+
+    def _listen(self, model, key):
+        """
+        Adds this object to the (stats, key) listeners of the model,
+        wrapping its comm on first use. Shared models may be tracked
+        by several CommStats objects.
+        """
+        listeners = getattr(model, '_comm_stats', None)
+        if listeners is None:
+            listeners = model._comm_stats = []
+            send = model._send
+            def _send(msg, buffers=None):
+                for stats, k in listeners:
+                    stats.record_sent(k, msg, buffers)
+                return send(msg, buffers)
+            model._send = _send
+
+            if model.comm is not None:
+                handle_msg = model._handle_msg
+                def _handle_msg(msg):
+                    for stats, k in listeners:
+                        stats.record_received(k, msg)
+                    return handle_msg(msg)
+                model.comm.on_msg(_handle_msg)
+        listeners.append((self, key))
+
+    @contextmanager
+    def measure(self):
+        """
+        Context manager yielding a CommStats object, which holds the
+        traffic that occurred within the context once it exits.
+        """
+        delta, before = type(self)(), self.copy()
+        yield delta
+        for c in self._counters:
+            counter = getattr(delta, c)
+            counter.update(getattr(self, c))
+            counter.subtract(getattr(before, c))
+            for key in [k for k, n in counter.items() if not n]:
+                del counter[key]
@@ -0,0 +1,275 @@
+"""
+Headless parameter sweeps, precomputing the rendered View outputs of a
+Parameterized object over a grid of parameter values in parallel.
+"""
+from __future__ import absolute_import
+
+import copy
+import json
+import pickle
+import sqlite3
+import zlib
+import itertools
+import multiprocessing
+from collections import OrderedDict
+
+import param
+
+from .util import get_method_owner, resolve
+from .view import View
+
+
+def param_values(p_obj):
+    """
+    Returns the values a widget offers for the supplied parameter,
+    i.e. the objects of a Selector, both Boolean states or the slider
+    positions within the (soft) bounds of a Number or Integer, or None
+    if the values cannot be enumerated.
+    """
+    if isinstance(p_obj, param.ListSelector):
+        return None
+    if hasattr(p_obj, 'get_range'):
+        return list(p_obj.get_range().values())
+    if isinstance(p_obj, param.Boolean):
+        return [False, True]
+    if isinstance(p_obj, param.Number) and hasattr(p_obj, 'get_soft_bounds'):
+        lower, upper = p_obj.get_soft_bounds()
+        if lower is None or upper is None:
+            return None
+        integer = isinstance(p_obj, param.Integer)
+        # Same defaults as IntSlider and FloatSlider
+        step = getattr(p_obj, 'step', None) or (1 if integer else 0.1)
+        n = int(round((upper - lower) / float(step)))
+        values = [lower + i*step for i in range(n+1)]
+        return values if integer else [round(v, 10) for v in values]
+    return None
+
+
+def settings_key(settings):
+    """
+    Returns a canonical string identifying a dictionary of parameter
+    settings, used to look up stored results.
+    """
+    def normalize(value):
+        if isinstance(value, float):
+            return round(value, 10)
+        if value is None or isinstance(value, (bool, int, str)):
+            return value
+        if hasattr(value, '__name__'):
+            return value.__name__
+        return repr(value)
+    return json.dumps([(k, normalize(settings[k])) for k in sorted(settings)])
+
+
+def _run_chunk(args):
+    """
+    Applies each of the settings in a chunk to a copy of the
+    parameterized object, runs the callback and returns the rendered
+    output of every View parameter.
+    """
+    parameterized, callback, chunk = args
+    results = []
+    for index, settings in chunk:
+        obj = copy.deepcopy(parameterized)
+        obj.set_param(**settings)
+        if callback is not None:
+            if get_method_owner(callback) is parameterized:
+                # Methods of the original object run on the copy
+                resolve(getattr(obj, callback.__name__)(**settings))
+            else:
+                resolve(callback(obj, **settings))
+        outputs = OrderedDict()
+        for name, p_obj in obj.params().items():
+            if isinstance(p_obj, View):
+                value = getattr(obj, name)
+                outputs[name] = None if value is None else resolve(p_obj.renderer(value))
+        results.append((index, settings, outputs))
+    return results
+
+
+class SweepStore(object):
+    """
+    Compact on-disk store of sweep results, an SQLite database holding
+    the compressed rendered View outputs keyed by parameter settings.
+
+    Stored results can be loaded back into an interactive panel by
+    supplying the replay method as the Widgets callback.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._conn = sqlite3.connect(filename)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS results '
+                           '(key TEXT PRIMARY KEY, settings BLOB, outputs BLOB)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def __iter__(self):
+        for settings, outputs in self._conn.execute('SELECT settings, outputs FROM results'):
+            yield self._loads(settings), self._loads(outputs)
+
+    @property
+    def names(self):
+        "Names of the parameters that were swept."
+        row = self._conn.execute("SELECT value FROM meta WHERE name='names'").fetchone()
+        return [] if row is None else json.loads(row[0])
+
+    @names.setter
+    def names(self, names):
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('names', ?)",
+                           (json.dumps(sorted(names)),))
+        self._conn.commit()
+
+    @staticmethod
+    def _dumps(obj):
+        return sqlite3.Binary(zlib.compress(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)))
+
+    @staticmethod
+    def _loads(data):
+        return pickle.loads(zlib.decompress(data))
+
+    def write(self, results):
+        "Writes a list of (settings, outputs) tuples."
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?)',
+            [(settings_key(s), self._dumps(s), self._dumps(o)) for s, o in results])
+        self._conn.commit()
+
+    def get(self, settings):
+        "Returns the rendered outputs stored for the settings, if any."
+        row = self._conn.execute('SELECT outputs FROM results WHERE key=?',
+                                 (settings_key(settings),)).fetchone()
+        return None if row is None else self._loads(row[0])
+
+    def replay(self, parameterized, **changed):
+        """
+        Displays the stored outputs for the current parameter values
+        of the parameterized object in its Widgets panel, returning
+        whether they were found. Suitable as a Widgets callback.
+        """
+        settings = {name: getattr(parameterized, name) for name in self.names}
+        outputs = self.get(settings)
+        if outputs is None:
+            return False
+        for name, rendered in outputs.items():
+            callback = parameterized.params(name).callbacks.get(id(parameterized))
+            if callback is not None and rendered is not None:
+                callback(rendered)
+        return True
+
+    def close(self):
+        self._conn.close()
+
+
+class Sweep(param.ParameterizedFunction):
+    """
+    Runs the callback and renders all View parameters of a
+    Parameterized object for every combination of parameter settings,
+    without displaying any widgets. Callback semantics are the same
+    as for Widgets, except that the callback is called with all swept
+    parameters as keyword arguments.
+
+    The settings are split into chunks which are distributed across a
+    pool of worker processes, so the parameterized object, callback,
+    values and rendered outputs must be picklable. Results are
+    streamed into a SweepStore as chunks complete, or returned as a
+    list of (settings, outputs) tuples if no store is given.
+    """
+
+    grid = param.Parameter(default=None, doc="""
+        The settings to sweep over: a dictionary mapping parameter
+        names to lists of values (or None to use the values the
+        widget offers), a list of parameter names, or an iterable of
+        settings dictionaries. By default, sweeps over every parameter
+        whose values can be enumerated.""")
+
+    callback = param.Callable(default=None, doc="""
+        Callable executed for each setting, as for Widgets.""")
+
+    processes = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+        Number of worker processes; defaults to the number of CPUs.
+        Zero runs the sweep serially in this process.""")
+
+    chunksize = param.Integer(default=16, bounds=(1, None), doc="""
+        Number of settings scheduled on a worker at a time.""")
+
+    store = param.Parameter(default=None, doc="""
+        Filename of, or SweepStore for, storing the results.""")
+
+    def __call__(self, parameterized, **params):
+        p = param.ParamOverrides(self, params)
+        names, settings = self._settings(parameterized, p.grid)
+
+        store = p.store
+        if isinstance(store, str):
+            store = SweepStore(store)
+        if store is not None:
+            store.names = names
+
+        chunks = ((parameterized, p.callback, chunk) for chunk in
+                  self._chunks(enumerate(settings), p.chunksize))
+
+        results = []
+        if p.processes == 0:
+            chunk_results = map(_run_chunk, chunks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(p.processes)
+            chunk_results = pool.imap_unordered(_run_chunk, chunks)
+        try:
+            for chunk in chunk_results:
+                if store is not None:
+                    store.write([(s, o) for _, s, o in chunk])
+                else:
+                    results.extend(chunk)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        if store is not None:
+            return store
+        return [(s, o) for _, s, o in sorted(results, key=lambda r: r[0])]
+
+    @staticmethod
+    def _chunks(iterable, size):
+        iterator = iter(iterable)
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _settings(parameterized, grid):
+        """
+        Returns the swept parameter names and an iterator over the
+        settings dictionaries.
+        """
+        params = parameterized.params()
+        if grid is None:
+            grid = [name for name, p_obj in params.items()
+                    if name != 'name' and not p_obj.constant]
+            grid = OrderedDict((name, param_values(params[name])) for name in grid)
+            grid = OrderedDict((k, v) for k, v in grid.items() if v is not None)
+        elif not isinstance(grid, dict):
+            grid = list(grid)
+            if all(isinstance(g, dict) for g in grid):
+                names = sorted(set(k for settings in grid for k in settings))
+                return names, iter(grid)
+            grid = OrderedDict((name, None) for name in grid)
+
+        values = OrderedDict()
+        for name, vals in grid.items():
+            if vals is None:
+                vals = param_values(params[name])
+                if vals is None:
+                    raise ValueError('Cannot enumerate values of parameter %r; '
+                                     'supply them explicitly.' % name)
+            values[name] = list(vals)
+        names = list(values)
+        return names, (dict(zip(names, combo)) for combo in
+                       itertools.product(*values.values()))
@@ -0,0 +1,6 @@
+import sys
+
+# Coroutine tests use async def and asyncio.run (Python 3.7+)
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.append('test_coroutines.py')
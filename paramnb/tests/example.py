@@ -0,0 +1,24 @@
+"""
+Parameterized class shared by the tests. Test modules subclass it to
+add or override only the parameters they exercise; subclasses need
+names of their own, since param caches parameters by class name.
+"""
+import param
+
+from paramnb.view import HTML
+
+
+class Example(param.Parameterized):
+
+    x = param.Number(default=1, bounds=(0, 10))
+
+    color = param.ObjectSelector(default='red', objects=['red', 'blue'])
+
+    l = param.List(default=[1, 2])
+
+    output = HTML()
+
+    def update(self, **changed):
+        "Records the changes passed and renders the output."
+        self.calls = getattr(self, 'calls', []) + [changed]
+        self.output = '<b>%s %s</b>' % (self.color, self.x)
@@ -0,0 +1,28 @@
+# Tests using async def belong in test_coroutines.py, which is only
+# collected on Python 3.7+
+import pytest
+
+import paramnb.util
+from paramnb.util import running_loop
+
+asyncio = paramnb.util.asyncio
+
+
+@pytest.mark.skipif(asyncio is None, reason="Requires asyncio")
+def test_running_loop_before_python37(monkeypatch):
+    # asyncio.get_running_loop is not available, e.g. on Python 3.6
+    monkeypatch.setattr(paramnb.util.sys, 'version_info', (3, 6, 0))
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    found = []
+    def check():
+        found.append(running_loop())
+        loop.stop()
+    try:
+        loop.call_soon(check)
+        loop.run_forever()
+        assert found == [loop]
+        assert running_loop() is None
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,157 @@
+import asyncio
+import threading
+
+import param
+
+from paramnb import Widgets, Recorder, Replay, View, Profiler
+from paramnb.tests.example import Example
+
+
+class Sliders(Example):
+
+    y = param.Number(default=1, bounds=(0, 10))
+
+
+def test_coroutine_callback_superseded():
+    calls = []
+
+    async def callback(obj, **changed):
+        await asyncio.sleep(0.01)
+        calls.append(changed)
+
+    async def run():
+        widgets = Widgets.instance()
+        widgets(Sliders(), callback=callback)
+        widgets._widgets['x'].value = 2
+        widgets._widgets['x'].value = 3
+        await asyncio.sleep(0.05)
+        return widgets
+
+    widgets = asyncio.run(run())
+    assert calls == [{'x': 3}]
+    assert widgets._tasks == {}
+
+
+def test_superseded_coroutine_callback_changes_are_merged():
+    calls = []
+
+    async def callback(obj, **changed):
+        await asyncio.sleep(0.01)
+        calls.append(changed)
+
+    async def run():
+        widgets = Widgets.instance()
+        widgets(Sliders(), callback=callback)
+        widgets._widgets['x'].value = 2
+        widgets._widgets['y'].value = 3
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert calls == [{'x': 2, 'y': 3}]
+
+
+def test_coroutine_callback_without_event_loop():
+    calls = []
+
+    async def callback(obj, **changed):
+        await asyncio.sleep(0)
+        calls.append(changed)
+
+    widgets = Widgets.instance()
+    widgets(Sliders(), callback=callback)
+    widgets._widgets['x'].value = 2
+    assert calls == [{'x': 2}]
+    assert widgets._tasks == {}
+
+
+def test_coroutine_initializer_builds_widgets_when_done():
+    async def initializer(obj):
+        await asyncio.sleep(0)
+        obj.x = 5
+
+    async def run():
+        widgets = Widgets.instance()
+        widgets(Sliders(), initializer=initializer)
+        assert widgets._widgets == {}
+        await asyncio.sleep(0.01)
+        return widgets
+
+    widgets = asyncio.run(run())
+    assert widgets._widgets['x'].value == 5
+
+
+
+def test_replay_coroutine_initializer():
+    recorder = Recorder()
+    recorder.events = [[0, 'change', 'x', 2]]
+
+    async def initializer(obj):
+        await asyncio.sleep(0)
+        obj.l = [9]
+
+    example = Example()
+    Replay(recorder, example, speed=None, initializer=initializer,
+           callback=Example.update)
+    assert example.l == [9]
+    assert example.calls == [{'x': 2}]
+
+
+class Threaded(Example):
+
+    output = View()
+
+    def compute(self, **changed):
+        self.gate.wait(1)
+        self.output = threading.current_thread().name
+
+
+def test_snapshot_revalidated_off_the_event_loop(tmpdir):
+    directory = str(tmpdir)
+    obj = Threaded(x=4)
+    obj.gate = threading.Event()
+    obj.gate.set()
+    Widgets(obj, snapshot=directory, on_init=True, callback=obj.compute)
+
+    async def run():
+        restored = Threaded(x=4)
+        restored.gate = threading.Event()
+        widgets = Widgets.instance()
+        widgets(restored, snapshot=directory, on_init=True, callback=restored.compute)
+        # The loop is not blocked while the callback waits
+        await asyncio.sleep(0.01)
+        assert widgets._rendered['output'] == 'MainThread'
+        restored.gate.set()
+        for i in range(100):
+            await asyncio.sleep(0.01)
+            if widgets._rendered['output'] != 'MainThread':
+                break
+        return widgets
+
+    widgets = asyncio.run(run())
+    assert widgets._rendered['output'] != 'MainThread'
+
+
+def test_coroutines_profiled_once():
+    async def render(value):
+        await asyncio.sleep(0)
+        return value
+
+    class Rendered(Example):
+
+        output = View(renderer=render)
+
+    async def callback(obj, **changed):
+        await asyncio.sleep(0)
+        obj.output = obj.x
+
+    async def run():
+        widgets = Widgets.instance()
+        widgets(Rendered(), callback=callback, profiler=profiler)
+        widgets._widgets['x'].value = 2
+        await asyncio.sleep(0.05)
+
+    profiler = Profiler()
+    asyncio.run(run())
+    summary = profiler.summary()
+    assert summary['callback']['count'] == 1
+    assert summary['render']['count'] == 1
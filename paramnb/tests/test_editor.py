@@ -0,0 +1,54 @@
+import param
+
+from paramnb import Widgets
+from paramnb.tests.example import Example
+
+
+def nested(levels):
+    "Returns a class whose 'child' selector nests the given levels."
+    child = Example()
+    for i in range(levels):
+        cls = param.parameterized.ParameterizedMetaclass(
+            'Level%d' % i, (param.Parameterized,),
+            {'child': param.ObjectSelector(default=child, objects=[child])})
+        child = cls()
+    return child
+
+
+def test_editor_is_cached_and_refreshed():
+    obj = nested(1)
+    panel = Widgets.instance()
+    panel(obj)
+    dropdown = panel.widget('child')
+    dropdown._edit.click()
+    editor = dropdown._editor(obj.child)
+    assert dropdown._editor_box.children == (editor._widget_box,)
+
+    # Pressing again hides the editor, and then shows the same panel
+    dropdown._edit.click()
+    assert dropdown._editor_box.children == ()
+    obj.child.x = 5
+    changes = []
+    editor.widget('color').observe(changes.append, 'value')
+    dropdown._edit.click()
+    assert dropdown._editor(obj.child) is editor
+    assert editor.widget('x').value == 5
+    assert changes == []
+
+
+def test_editor_depth_limit_and_close():
+    obj = nested(4)
+    panel = Widgets.instance()
+    panel(obj)
+    dropdowns = [panel.widget('child')]
+    while True:
+        dropdown = dropdowns[-1]
+        if dropdown._edit.layout.display == 'none':
+            break
+        dropdown._edit.click()
+        dropdowns.append(dropdown._editor(dropdown.value).widget('child'))
+    assert len(dropdowns) == dropdowns[0].max_depth + 1
+
+    panel.close()
+    assert all(d._select.comm is None for d in dropdowns)
+    assert dropdowns[0]._editors == {}
@@ -0,0 +1,71 @@
+import param
+
+from paramnb import Widgets, PanelGroup
+from paramnb.tests.example import Example
+
+
+class Model(Example):
+
+    start = param.Integer(default=0, bounds=(0, 100))
+
+    offset = param.Integer(default=0, bounds=(0, 100))
+
+    def __init__(self, **params):
+        super(Model, self).__init__(**params)
+        self.calls = []
+
+
+def test_group_links_parameters_and_executes_each_member_once():
+    group = PanelGroup()
+    group.link('start')
+    loads = []
+
+    @group.shared
+    def load(start):
+        loads.append(start)
+        return start * 10
+
+    def callback(obj, **changed):
+        obj.calls.append((changed, load(obj.start)))
+
+    models = [Model(), Model(), Model()]
+    panels = []
+    for model in models:
+        widgets = Widgets.instance()
+        widgets(model, callback=callback, group=group)
+        panels.append(widgets)
+
+    panels[0].widget('start').value = 5
+    assert [m.start for m in models] == [5, 5, 5]
+    assert [w.widget('start').value for w in panels] == [5, 5, 5]
+    assert [m.calls for m in models] == [[({'start': 5}, 50)]] * 3
+    assert loads == [5]
+
+    # Unlinked parameters only execute their own panel
+    panels[1].widget('x').value = 2
+    assert [len(m.calls) for m in models] == [1, 2, 1]
+
+
+def test_group_links_differently_named_parameters():
+    group = PanelGroup()
+    a, b = Model(), Model()
+    group.link((a, 'start'), (b, 'offset'))
+    Widgets(a, group=group)
+    panel = Widgets.instance()
+    panel(b, group=group)
+    panel.widget('offset').value = 3
+    assert a.start == 3
+
+
+def test_closed_panel_leaves_group():
+    group = PanelGroup()
+    group.link('start')
+    a, b = Model(), Model()
+    first = Widgets.instance()
+    first(a, group=group)
+    second = Widgets.instance()
+    second(b, group=group)
+    second.close()
+    assert group.members == [first]
+    first.widget('start').value = 4
+    assert b.start == 0
@@ -0,0 +1,27 @@
+import sys
+import subprocess
+
+
+def imported_modules(statement):
+    code = "import sys; %s; print(' '.join(sys.modules))" % statement
+    return subprocess.check_output([sys.executable, '-c', code]).decode().split()
+
+
+def test_import_does_not_load_widget_stack():
+    modules = imported_modules('import paramnb; paramnb.JSONInit; paramnb.HTMLView')
+    assert 'ipywidgets' not in modules
+    assert 'IPython' not in modules
+    assert 'paramnb.widgets' not in modules
+
+
+def test_widgets_loaded_on_first_use():
+    modules = imported_modules('import paramnb; paramnb.Widgets')
+    assert 'ipywidgets' in modules
+    assert 'paramnb.widgets' in modules
+
+
+def test_star_import_exports_lazy_names():
+    namespace = {}
+    exec('from paramnb import *', namespace)
+    assert namespace['Widgets'].__module__ == 'paramnb.core'
+    assert 'run_next_cells' in namespace and 'View' in namespace
@@ -0,0 +1,54 @@
+import os
+import json
+
+from paramnb import JSONInit
+from paramnb import jsoninit
+from paramnb.tests.example import Example
+
+
+def write(fname, spec):
+    with open(fname, 'w') as f:
+        json.dump(spec, f)
+
+
+def test_json_file_parsed_once_and_reloaded_on_change(tmpdir, monkeypatch):
+    fname = str(tmpdir.join('spec.json'))
+    write(fname, {'Example': {'x': 2, 'l': [1]}, 'Other': {'y': 1}})
+    init = JSONInit(json_file=fname)
+    loads = []
+    parse = jsoninit._parse
+    monkeypatch.setattr(jsoninit, '_parse', lambda text: loads.append(text) or parse(text))
+
+    objects = [Example() for _ in range(5)]
+    for obj in objects:
+        init(obj)
+    assert len(loads) == 1
+    assert [obj.x for obj in objects] == [2]*5
+    objects[0].l.append(2)
+    assert objects[1].l == [1]
+
+    write(fname, {'Example': {'x': 3, 'l': [1, 2, 3]}})
+    os.utime(fname, (0, 0))
+    obj = Example()
+    init(obj)
+    assert len(loads) == 2
+    assert obj.x == 3
+
+
+def test_invalid_keys_reported_individually(monkeypatch):
+    monkeypatch.setenv('PARAMNB_INIT', json.dumps({'x': 20, 'l': [1], 'z': 0}))
+    obj = Example()
+    warnings = []
+    monkeypatch.setattr(obj, 'warning', lambda msg, *args: warnings.append(msg))
+    JSONInit()(obj)
+    assert obj.l == [1] and obj.x == 1
+    assert len(warnings) == 2
+    assert "'z'" in warnings[0] and "'x'" in warnings[1]
+
+
+def test_missing_file_warns(tmpdir, monkeypatch):
+    obj = Example()
+    warnings = []
+    monkeypatch.setattr(obj, 'warning', lambda msg, *args: warnings.append(msg))
+    JSONInit(json_file=str(tmpdir.join('missing.json')))(obj)
+    assert len(warnings) == 1 and 'Could not load JSON file' in warnings[0]
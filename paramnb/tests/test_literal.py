@@ -0,0 +1,52 @@
+import param
+
+from paramnb import Widgets
+from paramnb.widgets import LiteralEditor, parse_literal, format_literal
+from paramnb.tests.example import Example
+
+
+class Literals(Example):
+
+    d = param.Dict(default={'k%d' % i: i for i in range(200)})
+
+    t = param.Tuple(default=(1, 2))
+
+
+def test_parse_literal_json_and_python_syntax():
+    assert parse_literal('{"a": [1, 2.5, null]}') == {'a': [1, 2.5, None]}
+    assert parse_literal("{1: 'a', 'b': (None, True)}") == {1: 'a', 'b': (None, True)}
+    assert parse_literal('[1, 2]', Literals.params('t')) == (1, 2)
+
+
+def test_format_literal_prefers_json():
+    assert format_literal({'a': ['b', None]}) == '{"a": ["b", null]}'
+    assert format_literal((1, 2), as_tuple=True) == '[1, 2]'
+    assert format_literal((1, 2)) == '(1, 2)'
+    assert format_literal({1: 'a'}) == "{1: 'a'}"
+    assert format_literal({'a': (1, 2)}) == "{'a': (1, 2)}"
+
+
+def test_large_dict_uses_literal_editor_with_item_edits():
+    example = Literals()
+    widgets = Widgets.instance()
+    widgets(example)
+    editor = widgets.widget('d')
+    assert isinstance(editor, LiteralEditor)
+    assert widgets.widget('t').value == '[1, 2]'
+
+    editor._key.value = 'k5'
+    assert editor._text.value == '5'
+    before = example.d
+    editor._text.value = '[5]'
+    assert example.d['k5'] == [5] and example.d is not before
+    assert before['k5'] == 5
+
+    editor._text.value = '[5'
+    assert example.d['k5'] == [5]
+    assert 'paramnb-error-eval' in editor._text._dom_classes
+
+    editor.value = {'a': 1, 'b': 'text'}
+    assert list(editor._key.options) == ['a', 'b']
+    assert editor._text.value == '1'
+    editor._key.value = 'b'
+    assert editor._text.value == '"text"'
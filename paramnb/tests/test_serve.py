@@ -0,0 +1,100 @@
+import json
+import threading
+
+try:
+    from urllib.request import Request, build_opener, HTTPCookieProcessor
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib2 import Request, build_opener, HTTPCookieProcessor
+    from urllib import urlencode
+
+import param
+
+from paramnb.serve import PanelServer
+from paramnb.view import HTML
+from paramnb.tests.example import Example
+
+
+class Served(Example):
+
+    x = param.Integer(default=1, bounds=(0, 10))
+
+
+def test_sessions_share_cache_and_are_reaped():
+    panel = PanelServer(target=Served, callback='update')
+    first, second = panel.session('a'), panel.session('b')
+    assert first.parameterized is not second.parameterized
+
+    result = panel.update(first, {'x': '3', 'color': 'blue'})
+    assert result == {'views': {'output': '<b>blue 3</b>'}, 'errors': {}}
+    assert panel.update(second, {'x': '3', 'color': 'blue'})['views'] == result['views']
+    assert not hasattr(second.parameterized, 'calls')
+
+    assert 'x' in panel.update(first, {'x': '20'})['errors']
+    assert first.parameterized.x == 3
+
+    first.last_access = 0
+    panel.reap()
+    assert list(panel.sessions) == ['b']
+
+
+class Hidden(Served):
+
+    offset = param.Integer(default=0, precedence=-1)
+
+    def update(self, **changed):
+        self.output = str(self.x + self.offset)
+
+
+def test_cache_keyed_on_hidden_parameters():
+    panel = PanelServer(target=Hidden, callback='update')
+    first, second = panel.session('a'), panel.session('b')
+    second.parameterized.offset = 10
+    assert panel.update(first, {'x': '3'})['views'] == {'output': '3'}
+    assert panel.update(second, {'x': '3'})['views'] == {'output': '13'}
+
+
+def test_http_roundtrip():
+    panel = PanelServer(target=Served, callback='update')
+    server = panel.make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        url = 'http://127.0.0.1:%d/' % server.server_address[1]
+        opener = build_opener(HTTPCookieProcessor())
+        page = opener.open(url).read().decode('utf-8')
+        assert 'id="view-output"' in page and '<b>red 1</b>' in page
+        data = urlencode({'x': 4, 'color': 'red'}).encode('utf-8')
+        result = json.loads(opener.open(Request(url + 'update', data)).read().decode('utf-8'))
+        assert result['views'] == {'output': '<b>red 4</b>'}
+        assert len(panel.sessions) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class Partial(param.Parameterized):
+
+    x = param.Integer(default=0, bounds=(0, 10))
+
+    y = param.Integer(default=0, bounds=(0, 10))
+
+    vx = HTML()
+
+    vy = HTML()
+
+    def update(self, **changed):
+        # Only updates the Views affected by the change
+        for name in changed:
+            setattr(self, 'v' + name, '%s=%s' % (name, changed[name]))
+
+
+def test_cache_hit_applies_view_values():
+    panel = PanelServer(target=Partial, callback='update')
+    first, second = panel.session('a'), panel.session('b')
+    panel.update(first, {'x': '1'})
+    assert panel.update(second, {'x': '1'})['views'] == {'vx': 'x=1'}
+    assert second.parameterized.vx == 'x=1'
+    assert panel.update(second, {'y': '2'})['views'] == {'vx': 'x=1', 'vy': 'y=2'}
+    assert panel.update(first, {'y': '2'})['views'] == {'vx': 'x=1', 'vy': 'y=2'}
@@ -0,0 +1,47 @@
+from paramnb import Widgets, Recorder, Replay
+from paramnb.tests.example import Example
+
+
+def test_record_and_replay(tmpdir):
+    recorder = Recorder()
+    widgets = Widgets.instance()
+    widgets(Example(), recorder=recorder, callback=Example.update)
+    widgets.widget('x').value = 3
+    widgets.widget('color').value = 'blue'
+    widgets.widget('l').value = '[3]'
+    assert [e[1:] for e in recorder.events] == [
+        ['change', 'x', 3], ['change', 'color', {'label': 'blue'}],
+        ['change', 'l', '[3]']]
+    assert recorder.target == 'paramnb.tests.example.Example'
+
+    fname = str(tmpdir.join('session.jsonl.gz'))
+    recorder.save(fname)
+
+    example = Example()
+    report = Replay(fname, example, speed=None, callback=Example.update)
+    assert len(report.latencies) == 3
+    assert (example.x, example.color, example.l) == (3, 'blue', [3])
+    assert example.calls == [{'x': 3}, {'color': 'blue'}, {'l': [3]}]
+    assert report.throughput > 0
+
+
+def test_replay_run_button():
+    recorder = Recorder()
+    recorder.events = [[0, 'change', 'x', 2], [0.01, 'click', None, None]]
+    example = Example()
+    Replay(recorder, example, speed=10, button=True, callback=Example.update)
+    assert example.calls == [{'x': 2}]
+
+
+def test_replay_click_without_button_and_initializer():
+    recorder = Recorder()
+    recorder.events = [[0, 'change', 'x', 2], [0.01, 'click', None, None]]
+
+    def initializer(obj):
+        obj.l = [9]
+
+    example = Example()
+    Replay(recorder, example, speed=None, initializer=initializer,
+           callback=Example.update)
+    assert example.l == [9]
+    assert example.calls == [{'x': 2}, {}]
@@ -0,0 +1,69 @@
+import paramnb.core
+from paramnb import Widgets, View
+from paramnb.snapshot import load_snapshot
+from paramnb.tests.example import Example
+
+
+class Snapshotted(Example):
+
+    output = View()
+
+    double = View()
+
+    triple = View()
+
+    def __init__(self, **params):
+        super(Snapshotted, self).__init__(**params)
+        self.computed = 0
+
+    def compute(self, **changed):
+        self.computed += 1
+        self.output = self.x
+        self.double = self.x * 2
+        self.triple = self.x * 3
+
+
+def test_snapshot_saved_once_per_execution(tmpdir, monkeypatch):
+    saves = []
+    monkeypatch.setattr(paramnb.core, 'save_snapshot',
+                        lambda *args: saves.append(args))
+    obj = Snapshotted()
+    widgets = Widgets.instance()
+    widgets(obj, snapshot=str(tmpdir), callback=obj.compute)
+    widgets.widget('x').value = 3
+    assert len(saves) == 1
+
+
+def test_snapshot_restores_outputs_for_same_values(tmpdir):
+    directory = str(tmpdir)
+    obj = Snapshotted()
+    widgets = Widgets.instance()
+    widgets(obj, snapshot=directory, on_init=True, callback=obj.compute)
+    widgets.widget('x').value = 3
+    assert load_snapshot(directory, obj) == {'output': 3, 'double': 6, 'triple': 9}
+
+    # Restored without running the callback before the panel is built
+    restored = Snapshotted(x=3)
+    widgets = Widgets.instance()
+    widgets(restored, snapshot=directory, callback=restored.compute)
+    assert restored.computed == 0
+    assert widgets._rendered['double'] == 6
+
+    # Explicit values are kept, and only restore matching outputs
+    other = Snapshotted(x=7)
+    widgets = Widgets.instance()
+    widgets(other, snapshot=directory, callback=other.compute)
+    assert other.x == 7
+    assert widgets._restored == {}
+
+
+def test_snapshot_revalidates_on_init(tmpdir):
+    directory = str(tmpdir)
+    obj = Snapshotted(x=4)
+    Widgets(obj, snapshot=directory, on_init=True, callback=obj.compute)
+
+    restored = Snapshotted(x=4)
+    Widgets(restored, snapshot=directory, on_init=True, callback=restored.compute)
+    # No event loop is running, so revalidation happens immediately
+    assert restored.computed == 1
+    assert restored.double == 8
@@ -0,0 +1,35 @@
+from paramnb import Widgets
+from paramnb.tests.example import Example
+
+
+def test_comm_stats_per_parameter():
+    widgets = Widgets.instance()
+    widgets(Example(), track_comms=True, callback=Example.update)
+    stats = widgets.comm_stats
+    assert stats.models['x'] > 0 and stats.models[None] > 0
+
+    with stats.measure() as interaction:
+        widgets._widgets['x'].value = 2
+    assert set(interaction.sent) == {'x', 'output'}
+    assert interaction.models == {}
+    assert interaction.sent_bytes['output'] > 0
+
+
+def test_comm_stats_of_panels_sharing_models():
+    first, second = Widgets.instance(), Widgets.instance()
+    first(Example(), track_comms=True)
+    second(Example(), track_comms=True)
+    for widgets in (first, second):
+        stats = widgets.comm_stats
+        assert stats.models['shared'] > 0
+        assert stats.models['x'] == first.comm_stats.models['x']
+
+    with first.comm_stats.measure() as interaction:
+        second._widgets['x'].value = 2
+    assert interaction.sent == {}
+
+
+def test_comm_stats_disabled_by_default():
+    widgets = Widgets.instance()
+    widgets(Example())
+    assert widgets.comm_stats is None
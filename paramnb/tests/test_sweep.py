@@ -0,0 +1,51 @@
+import param
+
+from paramnb import Widgets
+from paramnb.sweep import Sweep, SweepStore, param_values
+from paramnb.tests.example import Example
+
+
+class Swept(Example):
+
+    x = param.Integer(default=1, bounds=(0, 3))
+
+
+def test_param_values_follow_widgets():
+    params = Swept.params()
+    assert param_values(params['x']) == [0, 1, 2, 3]
+    assert param_values(params['color']) == ['red', 'blue']
+    assert param_values(param.Number(0, bounds=(0, 0.3))) == [0, 0.1, 0.2, 0.3]
+    assert param_values(param.Number(0)) is None
+
+
+def test_param_values_use_widget_step():
+    class Stepped(param.Parameterized):
+        y = param.Number(default=0, bounds=(0, 1), step=0.5)
+
+    widgets = Widgets.instance()
+    widgets(Stepped())
+    slider = widgets.widget('y')
+    assert slider.step == 0.5
+    assert param_values(Stepped.params('y')) == [0, 0.5, 1]
+
+
+def test_sweep_serial_renders_all_settings():
+    example = Swept()
+    results = Sweep(example, callback=example.update, processes=0, chunksize=3)
+    assert len(results) == 8
+    assert results[-1] == ({'x': 3, 'color': 'blue'}, {'output': '<b>blue 3</b>'})
+
+
+def test_sweep_pool_streams_to_store_and_replays(tmpdir):
+    fname = str(tmpdir.join('sweep.db'))
+    store = Sweep(Swept(), grid={'x': [1, 2], 'color': None},
+                  callback=Swept.update, processes=2, chunksize=1, store=fname)
+    assert len(store) == 4
+    store.close()
+
+    store = SweepStore(fname)
+    example = Swept(x=2, color='blue')
+    displayed = []
+    example.params('output').callbacks[id(example)] = displayed.append
+    assert store.replay(example)
+    assert displayed == ['<b>blue 2</b>']
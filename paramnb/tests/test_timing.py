@@ -0,0 +1,32 @@
+import json
+
+from paramnb import Widgets, Profiler
+from paramnb.tests.example import Example
+
+
+def test_profiler_records_pipeline_stages(tmpdir):
+    profiler = Profiler()
+    widgets = Widgets.instance()
+    widgets(Example(), callback=Example.update, profiler=profiler)
+    widgets._widgets['x'].value = 2
+    widgets._widgets['l'].value = '[1, 2, 3]'
+
+    summary = profiler.summary()
+    assert set(summary) == {'eval', 'validate', 'callback', 'render', 'display'}
+    assert summary['validate']['count'] == 2
+    assert ('render', 'output') in [event[:2] for event in profiler.timeline]
+
+    fname = str(tmpdir.join('trace.json'))
+    profiler.save_trace(fname)
+    with open(fname) as f:
+        events = json.load(f)['traceEvents']
+    assert len(events) == len(profiler.timeline)
+    assert all(event['ph'] == 'X' for event in events)
+
+
+def test_profiler_overlay_updates():
+    profiler = Profiler()
+    overlay = profiler.overlay()
+    with profiler.timer('callback'):
+        pass
+    assert 'callback' in overlay.value
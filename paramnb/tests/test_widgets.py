@@ -0,0 +1,34 @@
+import param
+
+from paramnb import Widgets
+from paramnb.widgets import shared_layout
+from paramnb.tests.example import Example
+
+
+class Sheet(Example):
+
+    y = param.Number(default=1, bounds=(0, 10))
+
+    s = param.String(default='a')
+
+
+def test_widgets_share_layout_and_style_models():
+    widgets = Widgets.instance()
+    widgets(Sheet())
+    x, y = widgets.widget('x'), widgets.widget('y')
+    assert x.layout is y.layout is widgets.widget('s').layout
+    assert x.style is y.style
+    assert shared_layout(width='10px') is shared_layout(width='10px')
+
+
+def test_error_style_uses_css_classes():
+    widgets = Widgets.instance()
+    widgets(Sheet())
+    l = widgets.widget('l')
+    l.value = '1'
+    assert l._dom_classes == ('paramnb-error',)
+    l.value = '[1'
+    assert l._dom_classes == ('paramnb-error-eval',)
+    l.value = '[1]'
+    assert l._dom_classes == ()
+    assert l.layout is widgets.widget('s').layout
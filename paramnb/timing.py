@@ -0,0 +1,150 @@
+"""
+Opt-in timing of the stages of the Widgets interaction pipeline.
+"""
+import json
+import math
+import time
+from collections import deque, OrderedDict
+
+import param
+
+from .util import is_awaitable
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    clock = time.time
+
+
+class _NullTimer(object):
+    """Reusable no-op stand-in for Profiler.timer."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+null_timer = _NullTimer()
+
+
+class _Timer(object):
+
+    __slots__ = ['profiler', 'stage', 'key', 'start']
+
+    def __init__(self, profiler, stage, key):
+        self.profiler, self.stage, self.key = profiler, stage, key
+
+    def __enter__(self):
+        self.start = clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.stage, self.key, self.start, clock() - self.start)
+        return False
+
+
+class Profiler(param.Parameterized):
+    """
+    Collects timings of the stages of the Widgets interaction
+    pipeline, keyed by parameter or View name:
+
+    * eval:     literal evaluation or instantiation of a widget value
+    * validate: setting (and validating) the parameter value
+    * callback: the user-supplied Widgets callback
+    * render:   a View parameter's renderer
+    * display:  updating the widget or Output displaying a View
+
+    Each stage keeps a histogram of durations in power-of-two
+    millisecond buckets, and the most recent events are kept as a
+    timeline which may be exported in the Chrome trace format
+    (viewable in chrome://tracing or https://ui.perfetto.dev).
+    Supply an instance as the profiler of Widgets to enable it.
+    """
+
+    timeline_length = param.Integer(default=1000, bounds=(0, None), doc="""
+        Number of recent events to keep in the timeline.""")
+
+    def __init__(self, **params):
+        super(Profiler, self).__init__(**params)
+        self._overlay = None
+        self.reset()
+
+    def reset(self):
+        "Clears all timings collected so far."
+        self.timeline = deque(maxlen=self.timeline_length)
+        self.histograms = OrderedDict()
+        self._totals = {}
+        self._origin = clock()
+        self._refresh()
+
+    def timer(self, stage, key=None):
+        "Returns a context manager timing the enclosed stage."
+        return _Timer(self, stage, key)
+
+    def timed_call(self, stage, key, fn):
+        """
+        Returns the result of calling fn, recording the time taken
+        unless it is awaitable, i.e. timed once it completes instead.
+        """
+        start = clock()
+        result = fn()
+        if not is_awaitable(result):
+            self.record(stage, key, start, clock() - start)
+        return result
+
+    def record(self, stage, key, start, duration):
+        "Records a stage that took duration seconds from start."
+        self.timeline.append((stage, key, start, duration))
+        bucket = 2.0**math.ceil(math.log(max(duration*1000, 1e-3), 2))
+        histogram = self.histograms.setdefault(stage, OrderedDict())
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        count, total, longest = self._totals.get(stage, (0, 0, 0))
+        self._totals[stage] = (count+1, total+duration, max(longest, duration))
+        if self._overlay is not None:
+            self._refresh()
+
+    def summary(self):
+        """
+        Returns a dictionary with the count and the total, mean and
+        maximum durations in seconds for each stage.
+        """
+        return OrderedDict(
+            (stage, dict(count=count, total=total, mean=total/count, max=longest))
+            for stage, (count, total, longest) in sorted(self._totals.items()))
+
+    def trace(self):
+        "Returns the timeline as a Chrome trace format dictionary."
+        events = [dict(name=stage if key is None else '%s:%s' % (stage, key),
+                       cat=stage, ph='X', pid=0, tid=0,
+                       ts=(start-self._origin)*1e6, dur=duration*1e6,
+                       args={'key': str(key)})
+                  for stage, key, start, duration in self.timeline]
+        return dict(traceEvents=events, displayTimeUnit='ms')
+
+    def save_trace(self, filename):
+        "Saves the timeline as a Chrome trace format JSON file."
+        with open(filename, 'w') as f:
+            json.dump(self.trace(), f)
+
+    def overlay(self):
+        """
+        Returns a small HTML widget summarizing the timings, which is
+        kept up to date as new events are recorded.
+        """
+        if self._overlay is None:
+            import ipywidgets
+            self._overlay = ipywidgets.HTML()
+            self._refresh()
+        return self._overlay
+
+    _row = '<tr><td>{0}</td><td>{1}</td><td>{2:.2f}</td><td>{3:.2f}</td></tr>'
+
+    def _refresh(self):
+        if self._overlay is None:
+            return
+        rows = [self._row.format(stage, s['count'], s['mean']*1000, s['max']*1000)
+                for stage, s in self.summary().items()]
+        self._overlay.value = (
+            '<table style="font-size: smaller"><tr><th>stage</th><th>count</th>'
+            '<th>mean (ms)</th><th>max (ms)</th></tr>%s</table>' % ''.join(rows))
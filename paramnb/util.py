@@ -2,6 +2,11 @@ import sys
 import inspect
 from collections import OrderedDict
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 if sys.version_info.major == 3:
     unicode = str
     basestring = str
@@ -42,3 +47,40 @@ def get_method_owner(meth):
             return meth.im_class if meth.im_self is None else meth.im_self
         else:
             return meth.__self__
+
+
+def is_awaitable(obj):
+    """
+    Returns whether the supplied object can be awaited, e.g. the
+    coroutine returned by calling an ``async def`` function.
+    """
+    return asyncio is not None and inspect.isawaitable(obj)
+
+
+def running_loop():
+    "Returns the running event loop, or None outside of one."
+    if asyncio is None:
+        return None
+    try:
+        if sys.version_info < (3, 7):
+            loop = asyncio.get_event_loop()
+            return loop if loop.is_running() else None
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop set in a thread other than the main thread
+        return None
+
+
+def resolve(value):
+    """
+    Runs the supplied value to completion on a new event loop if it
+    is awaitable, otherwise returns it unchanged. For use outside of a
+    running event loop, e.g. in worker processes or threads.
+    """
+    if is_awaitable(value):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(value)
+        finally:
+            loop.close()
+    return value
@@ -7,13 +7,17 @@ class View(param.Parameter):
     Additionally they allow supplying a renderer function which renders
     the display output. The renderer function should return the
     appropriate output for the View parameter (e.g. HTML or PNG data),
-    and may optionally supply the desired size of the viewport.
+    and may optionally supply the desired size of the viewport. The
+    renderer may also be a coroutine function, in which case Widgets
+    awaits it on the kernel's event loop, allowing several views to
+    render concurrently.
     """
 
-    __slots__ = ['callbacks', 'renderer']
+    __slots__ = ['callbacks', 'renderer', 'profilers']
 
     def __init__(self, default=None, callback=None, renderer=None, **kwargs):
         self.callbacks = {}
+        self.profilers = {}
         self.renderer = (lambda x: x) if renderer is None else renderer
         super(View, self).__init__(default, **kwargs)
 
@@ -21,7 +25,13 @@ class View(param.Parameter):
         super(View, self).__set__(obj, val)
         obj_id = id(obj)
         if obj_id in self.callbacks:
-            self.callbacks[obj_id](self.renderer(val))
+            profiler = self.profilers.get(obj_id)
+            if profiler is None:
+                rendered = self.renderer(val)
+            else:
+                rendered = profiler.timed_call('render', self.name,
+                                               lambda: self.renderer(val))
+            self.callbacks[obj_id](rendered)
 
 
 class HTML(View):
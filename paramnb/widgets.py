@@ -1,4 +1,6 @@
 import re
+import ast
+import json
 
 import param
 from param.parameterized import classlist
@@ -16,33 +18,163 @@ from .util import named_objs
 from .view import View, HTML as HTMLView, Image as ImageView
 
 
-# What to use for editing parameters of an object,
-# e.g. paramnb.Widgets class.
+# What to use for editing parameters of an object: a callable taking
+# the object and the nesting depth and returning an undisplayed panel
+# (see paramnb.core.sub_editor).
 editor = None
 
 
+# Layout and style models shared between all widgets with identical
+# settings, so that each widget does not open a model of its own.
+# Shared models must never be mutated; assign another one instead.
+_layouts = {}
+_styles = {}
+
+
+def _pool_key(settings):
+    return tuple(sorted((k, v) for k, v in settings.items() if v is not None))
+
+
+def shared_layout(**settings):
+    """
+    Returns a Layout with the supplied settings, shared with any other
+    widget requesting the same settings.
+    """
+    key = _pool_key(settings)
+    layout = _layouts.get(key)
+    if layout is None or layout.comm is None:
+        layout = _layouts[key] = Layout(**dict(key))
+    return layout
+
+
+def shared_style(style_class, **settings):
+    """
+    Returns an instance of the style class with the supplied settings,
+    shared with any other widget requesting the same style.
+    """
+    key = (style_class, _pool_key(settings))
+    style = _styles.get(key)
+    if style is None or style.comm is None:
+        style = _styles[key] = style_class(**dict(key[1]))
+    return style
+
+
+def shared_models():
+    "Returns the ids of all shared layout and style models."
+    return set(id(m) for pool in (_layouts, _styles) for m in pool.values())
+
+
+def pooled(widget_class, *args, **kw):
+    """
+    Instantiates the widget class using shared layout and style
+    models, unless specific ones are supplied.
+    """
+    traits = widget_class.class_traits()
+    if 'layout' in traits and kw.get('layout') is None:
+        kw['layout'] = shared_layout()
+    style = traits.get('style')
+    if style is not None and kw.get('style') is None:
+        kw['style'] = shared_style(style.klass)
+    return widget_class(*args, **kw)
+
+
+def close_widget(widget):
+    """
+    Closes a widget along with the children of boxes and the parts of
+    composite widgets, leaving shared layout and style models open.
+    """
+    for child in getattr(widget, 'children', ()):
+        close_widget(child)
+    composite = getattr(widget, '_composite', None)
+    if composite is not None and composite is not widget:
+        close_widget(composite)
+    widget.close()
+
+
 def FloatWidget(*args, **kw):
     """Returns appropriate slider or text boxes depending on bounds"""
     has_bounds = not (kw['min'] is None or kw['max'] is None)
-    return (FloatSlider if has_bounds else FloatText)(*args,**kw)
+    return pooled(FloatSlider if has_bounds else FloatText, *args, **kw)
 
 
 def IntegerWidget(*args, **kw):
     """Returns appropriate slider or text boxes depending on bounds"""
     has_bounds = not (kw['min'] is None or kw['max'] is None)
-    return (IntSlider if has_bounds else IntText)(*args,**kw)
+    return pooled(IntSlider if has_bounds else IntText, *args, **kw)
 
 
 def TextWidget(*args, **kw):
     """Forces a parameter value to be text"""
     kw['value'] = str(kw['value'])
-    return Text(*args,**kw)
+    return pooled(Text, *args, **kw)
+
+
+def parse_literal(text, p_obj=None):
+    """
+    Parses the text of a literal parameter widget, trying the much
+    faster JSON parser before falling back to ast.literal_eval.
+    Lists are converted to tuples for Tuple parameters.
+    """
+    try:
+        value = json.loads(text)
+    except ValueError:
+        value = ast.literal_eval(text)
+    if isinstance(p_obj, param.Tuple) and isinstance(value, list):
+        value = tuple(value)
+    return value
+
+
+def format_literal(value, as_tuple=False):
+    """
+    Returns the text of a literal parameter widget, as JSON if it
+    parses back to an equal value so that parse_literal can take the
+    JSON fast path, otherwise in Python syntax (e.g. for non-string
+    keys or nested tuples). A list read back is compared as a tuple
+    if as_tuple is set, as for Tuple parameters.
+    """
+    try:
+        text = json.dumps(value)
+        parsed = json.loads(text)
+    except (TypeError, ValueError):
+        return repr(value)
+    if as_tuple and isinstance(parsed, list):
+        parsed = tuple(parsed)
+    return text if parsed == value and type(parsed) is type(value) else repr(value)
+
+
+def LiteralText(*args, **kw):
+    """Text widget holding a literal value, see format_literal"""
+    value = kw['value']
+    kw['value'] = format_literal(value, isinstance(value, tuple))
+    return pooled(Text, *args, **kw)
+
+
+class LiteralWidget(param.ParameterizedFunction):
+    """
+    Selects the widget for a Dict, List or Tuple parameter depending
+    on the number of items, switching from a Text widget holding the
+    whole literal to a LiteralEditor for large containers.
+    """
+
+    item_limit = param.Integer(default=100, allow_None=True, doc="""
+        The number of items above which the LiteralEditor is used.
+        Setting the limit to None will disable the LiteralEditor
+        completely.""")
+
+    def __call__(self, *args, **kw):
+        value = kw.get('value')
+        if (self.item_limit is not None and isinstance(value, (dict, list, tuple))
+            and len(value) > self.item_limit):
+            return LiteralEditor(*args, **kw)
+        # Validation happens on commit (enter or loss of focus)
+        kw['continuous_update'] = False
+        return LiteralText(*args, **kw)
 
 
 def HTMLWidget(*args, **kw):
     """Forces a parameter value to be text, displayed as HTML"""
     kw['value'] = str(kw['value'])
-    return HTML(*args,**kw)
+    return pooled(HTML, *args, **kw)
 
 
 def DateWidget(*args, **kw):
@@ -52,14 +184,14 @@ def DateWidget(*args, **kw):
     """
     if kw.get('value') is None and 'min' in kw:
         kw['value'] = kw['min']
-    return DatePicker(*args, **kw)
+    return pooled(DatePicker, *args, **kw)
 
 
 def ColorWidget(*args, **kw):
     """Color widget to pick hex color (defaults to black)"""
     if kw.get('value') is None:
         kw['value'] = '#000000'
-    return ColorPicker(*args, **kw)
+    return pooled(ColorPicker, *args, **kw)
 
 
 class RangeWidget(param.ParameterizedFunction):
@@ -74,7 +206,7 @@ class RangeWidget(param.ParameterizedFunction):
     def __call__(self, *args, **kw):
         has_bounds = not (kw['min'] is None or kw['max'] is None)
         if not has_bounds:
-            return TextWidget(*args,**kw)
+            return LiteralText(*args,**kw)
         if all(kw[k] is None or isinstance(kw[k], int)
                for k in ['min', 'max']):
             widget = IntRangeSlider
@@ -83,7 +215,7 @@ class RangeWidget(param.ParameterizedFunction):
             widget = FloatRangeSlider
             if not 'step' in kw:
                 kw['step'] = float((kw['max'] - kw['min']))/self.steps
-        return widget(*args, **kw)
+        return pooled(widget, *args, **kw)
 
 
 class ListSelectorWidget(param.ParameterizedFunction):
@@ -102,16 +234,16 @@ class ListSelectorWidget(param.ParameterizedFunction):
     def __call__(self, *args, **kw):
         item_limit = kw.pop('item_limit', self.item_limit)
         if item_limit is not None and len(kw['options']) > item_limit:
-            return CrossSelect(*args, **kw)
+            return pooled(CrossSelect, *args, **kw)
         else:
-            return SelectMultiple(*args, **kw)
+            return pooled(SelectMultiple, *args, **kw)
 
 
 def ActionButton(*args, **kw):
     """Returns a ipywidgets.Button executing a paramnb.Action."""
     kw['description'] = str(kw['name'])
     value = kw["value"]
-    w = ipywidgets.Button(*args,**kw)
+    w = pooled(ipywidgets.Button, *args, **kw)
     if value: w.on_click(value)
     return w
 
@@ -133,36 +265,36 @@ class CrossSelect(SelectMultiple):
         unselected = [k for k in options if k not in selected]
 
         # Define whitelist and blacklist
-        self._lists = {False: SelectMultiple(options=unselected),
-                       True: SelectMultiple(options=selected)}
+        self._lists = {False: pooled(SelectMultiple, options=unselected),
+                       True: pooled(SelectMultiple, options=selected)}
 
         self._lists[False].observe(self._update_selection, 'value')
         self._lists[True].observe(self._update_selection, 'value')
 
         # Define buttons
-        button_layout = Layout(width='50px')
-        self._buttons = {False: Button(description='<<', layout=button_layout),
-                         True: Button(description='>>', layout=button_layout)}
+        button_layout = shared_layout(width='50px')
+        self._buttons = {False: pooled(Button, description='<<', layout=button_layout),
+                         True: pooled(Button, description='>>', layout=button_layout)}
         self._buttons[False].on_click(self._apply_selection)
         self._buttons[True].on_click(self._apply_selection)
 
         # Define search
-        self._search = {False: Text(placeholder='Filter available options'),
-                        True: Text(placeholder='Filter selected options')}
+        self._search = {False: pooled(Text, placeholder='Filter available options'),
+                        True: pooled(Text, placeholder='Filter selected options')}
         self._search[False].observe(self._filter_options, 'value')
         self._search[True].observe(self._filter_options, 'value')
 
         # Define Layout
-        no_margin = Layout(margin='0')
-        row_layout = Layout(margin='0', display='flex', justify_content='space-between')
+        no_margin = shared_layout(margin='0')
+        row_layout = shared_layout(margin='0', display='flex', justify_content='space-between')
 
-        search_row = HBox([self._search[False], self._search[True]])
-        search_row.layout = row_layout
-        button_box = VBox([self._buttons[True], self._buttons[False]],
-                          layout=Layout(margin='auto 0'))
-        tab_row = HBox([self._lists[False], button_box, self._lists[True]])
-        tab_row.layout = row_layout
-        self._composite = VBox([search_row, tab_row], layout=no_margin)
+        search_row = pooled(HBox, [self._search[False], self._search[True]],
+                            layout=row_layout)
+        button_box = pooled(VBox, [self._buttons[True], self._buttons[False]],
+                            layout=shared_layout(margin='auto 0'))
+        tab_row = pooled(HBox, [self._lists[False], button_box, self._lists[True]],
+                         layout=row_layout)
+        self._composite = pooled(VBox, [search_row, tab_row], layout=no_margin)
 
         self.observe(self._update_options, 'options')
         self.observe(self._update_value, 'value')
@@ -241,7 +373,7 @@ class CrossSelect(SelectMultiple):
         leftovers = sorted([o for o in other if o not in new and o != ''])
         self._lists[selected].options = merged if merged else ['']
         self._lists[not selected].options = leftovers if leftovers else ['']
-        self.value = [self._options_dict[o] for o in self._lists[True].options if o != '']
+        self.value = [self.options[o] for o in self._lists[True].options if o != '']
         self._apply_filters()
 
     def _ipython_display_(self, **kwargs):
@@ -253,7 +385,7 @@ class CrossSelect(SelectMultiple):
     def get_state(self, key=None, drop_defaults=False):
         # HACK: Lets this composite widget pretend to be a regular widget
         # when included into a layout.
-        if key in ['value', '_options_labels']:
+        if key in ['value', 'index', '_options_labels']:
             return super(CrossSelect, self).get_state(key)
         return self._composite.get_state(key)
 
@@ -264,7 +396,13 @@ class CrossSelect(SelectMultiple):
 class DropdownWithEdit(ipywidgets.Widget):
     """
     Dropdown, but displays an edit button if the current selection is
-    a parameterized object.
+    a parameterized object. The button shows an editor panel for the
+    selection below the dropdown, built on first use and cached per
+    object; showing a cached editor again only updates the widgets of
+    parameters that changed in the meantime.
+
+    Editors can be opened from within editors, i.e. nested
+    Parameterized objects are expanded lazily, up to max_depth levels.
     """
 
     # I couldn't figure out which widget class actually declares the
@@ -272,25 +410,98 @@ class DropdownWithEdit(ipywidgets.Widget):
     # can see value trait declared in ValueWidget...
     value = traitlets.Any()
 
+    # Nesting level of the panel holding this widget (not synced)
+    depth = traitlets.Int(0)
+
+    # Maximum nesting level of editors
+    max_depth = 3
+
     def __init__(self, *args, **kwargs):
-        self._select = Dropdown(*args,**kwargs)
-        self._edit = Button(description='...',
-                            layout=Layout(width='15px'))
-        self._composite = HBox([self._select,self._edit])
+        self._select = pooled(Dropdown, *args, **kwargs)
+        self._edit = pooled(Button, description='...',
+                            layout=shared_layout(width='15px'))
+        self._composite = pooled(HBox, [self._select,self._edit])
         super(DropdownWithEdit, self).__init__()
         self.layout = self._composite.layout
+        self._editors = {}
+        self._editor_box = None
+        self._shown = None
         # so that others looking at this widget's value get the
         # dropdown's value
         traitlets.link((self._select,'value'),(self,'value'))
-        self._edit.on_click(lambda _: editor(self._select.value))
-        self._select.observe(lambda e: self._set_editable(e['new']),'value')
+        self._edit.on_click(self._open_editor)
+        self._select.observe(lambda e: self._select_changed(e['new']),'value')
+        self._select.observe(self._options_changed, 'options')
+        self.observe(lambda e: self._set_editable(self._select.value), 'depth')
         self._set_editable(self._select.value)
 
+    def _editor(self, obj):
+        "Returns the open editor panel for obj, if any."
+        cached = self._editors.get(id(obj))
+        if cached is None or cached[1]._widget_box.comm is None:
+            return None
+        return cached[1]
+
+    def _open_editor(self, _):
+        obj = self._select.value
+        if self._shown is obj and self._editor(obj) is not None:
+            # Pressing the button again hides the editor
+            self._show_editor(None)
+        else:
+            self._show_editor(obj)
+
+    def _show_editor(self, obj):
+        if obj is None:
+            children = ()
+        else:
+            panel = self._editor(obj)
+            if panel is None:
+                if editor is None:
+                    # importing paramnb.core registers Widgets as the editor
+                    from . import core # noqa
+                panel = editor(obj, self.depth+1)
+                self._editors[id(obj)] = (obj, panel)
+            else:
+                panel.refresh()
+            children = (panel._widget_box,)
+
+        if self._editor_box is None:
+            if not children:
+                return
+            # Created on first use; wrapping moves it below the dropdown
+            self._editor_box = pooled(VBox, layout=shared_layout(width='100%'))
+            self._composite.layout = shared_layout(flex_flow='row wrap')
+            self._composite.children = (self._select, self._edit, self._editor_box)
+        self._editor_box.children = children
+        self._shown = obj
+
+    def _select_changed(self, v):
+        self._set_editable(v)
+        if self._shown is not None:
+            self._show_editor(v if self._editable(v) else None)
+
+    def _options_changed(self, event):
+        options = event['new']
+        values = options.values() if isinstance(options, dict) else options
+        current = set(id(v) for v in values)
+        for key in [k for k in self._editors if k not in current]:
+            self._editors.pop(key)[1].close()
+
+    def _editable(self, v):
+        return hasattr(v,'params') and self.depth < self.max_depth
+
     def _set_editable(self,v):
-        if hasattr(v,'params'):
-            self._edit.layout.display = None # i.e. make it visible
+        if self._editable(v):
+            self._edit.layout = shared_layout(width='15px') # i.e. make it visible
         else:
-            self._edit.layout.display = 'none'
+            self._edit.layout = shared_layout(width='15px', display='none')
+
+    def close(self):
+        for obj, panel in self._editors.values():
+            panel.close()
+        self._editors.clear()
+        close_widget(self._composite)
+        super(DropdownWithEdit, self).close()
 
     def _ipython_display_(self, **kwargs):
         self._composite._ipython_display_(**kwargs)
@@ -300,23 +511,112 @@ class DropdownWithEdit(ipywidgets.Widget):
         return self._composite.get_state(*args,**kw)
 
 
+class LiteralEditor(ipywidgets.Widget):
+    """
+    Editor for large dict, list or tuple values, showing a Dropdown of
+    the keys (or indices) and a Text widget for the value of the
+    selected item. Editing an item only parses and sends that item,
+    rather than re-serializing the whole container, and sets a copy
+    of the container with the item replaced as the new value. Items
+    cannot be added or removed.
+    """
+
+    value = traitlets.Any()
+
+    def __init__(self, *args, **kwargs):
+        self._key = pooled(Dropdown, layout=shared_layout(width='120px'))
+        self._text = pooled(Text, continuous_update=False)
+        self._composite = pooled(HBox, [self._key, self._text])
+        super(LiteralEditor, self).__init__()
+        self.layout = self._composite.layout
+        self._keys = None
+        self._syncing = False
+        self.observe(self._update_value, 'value')
+        self._key.observe(self._show_item, 'value')
+        self._text.observe(self._edit_item, 'value')
+        self.value = kwargs.get('value')
+
+    def _items(self):
+        if isinstance(self.value, dict):
+            return named_objs([(k, k) for k in self.value])
+        return list(range(len(self.value or [])))
+
+    def _update_value(self, event):
+        keys = list(event['new']) if isinstance(event['new'], dict) else len(event['new'] or [])
+        if keys != self._keys:
+            self._keys = keys
+            self._key.options = self._items()
+        self._show_item()
+
+    def _show_item(self, event=None):
+        key = self._key.value
+        text = '' if key is None else format_literal(self.value[key])
+        if self._text.value != text:
+            self._syncing = True
+            try:
+                self._text.value = text
+            finally:
+                self._syncing = False
+
+    def _edit_item(self, event):
+        if self._syncing or self._key.value is None:
+            return
+        try:
+            item = parse_literal(event['new'])
+        except Exception:
+            apply_error_style(self._text, 'eval')
+            return
+        apply_error_style(self._text, False)
+        if isinstance(self.value, dict):
+            value = dict(self.value)
+        else:
+            value = list(self.value)
+        value[self._key.value] = item
+        self.value = tuple(value) if isinstance(self.value, tuple) else value
+
+    def _ipython_display_(self, **kwargs):
+        self._composite._ipython_display_(**kwargs)
+
+    def get_state(self, *args, **kw):
+        # support layouts; see CrossSelect.get_state
+        return self._composite.get_state(*args,**kw)
+
+
+# CSS classes denoting the error state of a widget, styled by
+# error_css; 'eval' errors are distinguished from all others
+error_classes = {'eval': 'paramnb-error-eval', True: 'paramnb-error'}
+
+error_css = """
+          .paramnb-error-eval { border: 5px solid #FFCC00 }
+          .paramnb-error { border: 5px solid #cc0000 }
+"""
+
+
 def apply_error_style(w, error):
-    "Applies error styling to the supplied widget based on the error code"
-    if error:
-        color = '#FFCC00' if error == 'eval' else '#cc0000'
-        w.layout.border = '5px solid %s' % color
-    else:
-        w.layout.border = '0px'
+    """
+    Applies error styling to the supplied widget based on the error
+    code, by toggling CSS classes rather than modifying its (possibly
+    shared) layout.
+    """
+    w = getattr(w, '_composite', w)
+    css_class = error_classes['eval' if error == 'eval' else True] if error else None
+    for c in error_classes.values():
+        if c != css_class:
+            w.remove_class(c)
+    if css_class:
+        w.add_class(css_class)
 
 
 
-# Define parameters which should be evaluated using ast.literal_eval
+# Define parameters which should be evaluated using parse_literal
 literal_params = (param.Dict, param.List, param.Tuple)
 
 # Maps from Parameter type to ipython widget types with any options desired
 ptype2wtype = {
     param.Parameter:     TextWidget,
-    param.Dict:          TextWidget,
+    param.Dict:          LiteralWidget,
+    param.List:          LiteralWidget,
+    param.Tuple:         LiteralWidget,
     param.Selector:      DropdownWithEdit,
     param.Boolean:       ipywidgets.Checkbox,
     param.Number:        FloatWidget,